@@ -39,6 +39,10 @@ class ActivityConnection(object):
     ACTION = 40
     OPERATION = 50
 
+    # object data, declared in slots to keep connections compact
+    __slots__ = ("index", "source_pin", "source_name", "source_uid", "source_type",
+                 "target_pin", "target_name", "target_uid", "target_type")
+
     # Description:
     # This is class constructor.
     def __init__(self):
@@ -32,6 +32,9 @@
 # This class collects data and artefacts that belongs directly to layer of activity diagram.
 class ActivityDiagramLayer(object):
 
+    # object data, declared in slots to keep layers compact
+    __slots__ = ("connection_list", "interaction_uid_list", "node_list", "sorted_node_list")
+
     # Description:
     # This is class constructor.
     def __init__(self):
@@ -52,6 +55,9 @@ class ActivityDiagramLayer(object):
 # This class collects data and artefacts that belongs to layer of condition element on activity diagram.
 class ActivityConditionLayer(object):
 
+    # object data, declared in slots to keep layers compact
+    __slots__ = ("name", "uid", "clause_layer_list")
+
     # Description:
     # This is class constructor.
     def __init__(self):
@@ -71,6 +77,10 @@ class ActivityConditionLayer(object):
 # This class collects data and artefacts that belongs to layer of clause element on activity diagram.
 class ActivityClauseLayer(object):
 
+    # object data, declared in slots to keep layers compact
+    __slots__ = ("decision", "uid", "start_index", "end_index", "connection_list", "interaction_uid_list", "node_list",
+                 "sorted_node_list")
+
     # Description:
     # This is class constructor.
     def __init__(self):
@@ -43,6 +43,9 @@ class ActivityNode(object):
     OPERATION = 40
     CONDITION = 50
 
+    # object data, declared in slots to keep nodes compact
+    __slots__ = ("input_data_list", "interaction", "uid", "type", "dependency_list", "output_data_list")
+
     # Description:
     # This is class constructor.
     def __init__(self):
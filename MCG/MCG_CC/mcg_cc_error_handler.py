@@ -44,6 +44,12 @@ class ErrorHandler(object):
     # INTERFACE errors
     INT_ERR_INVALID_INTERFACE_ELEMENT_TYPE = 51
 
+    # SORTING errors
+    SORT_ERR_UNSATISFIED_NODE_DEPENDENCY = 101
+
+    # FINDING errors
+    FIND_ERR_REQUESTED_MODULE_NOT_FOUND = 151
+
     # Description:
     # This method records error (i.e. append error to error list), found during run of MCG CC.
     @staticmethod
@@ -65,6 +71,30 @@ class ErrorHandler(object):
             # append error to error list
             ErrorHandler.error_list.append(error)
 
+        # SORTING errors, range 101-150
+        elif error_code == ErrorHandler.SORT_ERR_UNSATISFIED_NODE_DEPENDENCY:
+            # set error notification
+            error = "ERROR " + str(error_code) + ": Unsatisfied dependency on " + str(error_info2) + \
+                    " was found in " + str(error_info1) + " node"
+            # append error to error list
+            ErrorHandler.error_list.append(error)
+
+        # FINDING errors, range 151-200
+        elif error_code == ErrorHandler.FIND_ERR_REQUESTED_MODULE_NOT_FOUND:
+            # set error notification
+            error = "ERROR " + str(error_code) + ": Requested module " + str(error_info1) + \
+                    " was not found in model"
+            # append error to error list
+            ErrorHandler.error_list.append(error)
+
+    # Description:
+    # This method returns true if any error was recorded.
+    @staticmethod
+    def errors_found():
+
+        # return flag
+        return len(ErrorHandler.error_list) > 0
+
     # Description:
     # This method checks if any error was recorded and if yes, then it ends run of MCG CC.
     @staticmethod
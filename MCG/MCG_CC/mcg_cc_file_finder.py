@@ -28,7 +28,11 @@
 #       along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
-from os import listdir
+from os import scandir
+from os.path import join
+from mcg_cc_error_handler import ErrorHandler
+from mcg_cc_file_lines import FileLines
+from mcg_cc_file_parser import FileParser
 from mcg_cc_file_supporter import FileSupporter
 from mcg_cc_logger import Logger
 
@@ -37,30 +41,49 @@ from mcg_cc_logger import Logger
 # This class allows to find .exml files, which describe module content.
 class FileFinder(object):
 
-    # class data
-    activity_source_path_list = []
-    module_source_path_list = []
-    number_of_activity_files = 0
-    number_of_module_files = 0
-    activity_index = 0
-    module_index = 0
-
-    # module and activity finder state
-    module_finder_state = 0
-    activity_finder_state = 0
-    # possible states
+    # indexes of entries of file class dictionary
+    FILE_KEY_INDEX = 0
+    FILE_CLASS_LIST_INDEX = 1
+    OPERATION_UID_SET_INDEX = 2
+
+    # indexes of .exml file entries
+    FILE_PATH_INDEX = 0
+    FILE_SIZE_INDEX = 1
+    FILE_MTIME_INDEX = 2
+
+    # indexes of module and activity index entries
+    SOURCE_PATH_INDEX = 0
+    SOURCE_NAME_INDEX = 1
+    SOURCE_UID_INDEX = 2
+
+    # possible classes of .exml file
+    OTHER_FILE = 10
+    MODULE_FILE = 20
+    ACTIVITY_FILE = 30
+
+    # indexes of file class data
+    FILE_CLASS_INDEX = 0
+    ELEMENT_NAME_INDEX = 1
+    ELEMENT_UID_INDEX = 2
+    PARENT_NAME_INDEX = 3
+    PARENT_UID_INDEX = 4
+
+    # marker of operation definition in module .exml file, searched by byte scan
+    OWNED_OPERATION_MARKER = b"<COMP relation=\"OwnedOperation\">"
+    # number of lines between operation definition marker and line with operation details
+    OPERATION_ID_OFFSET = 2
+    # relation of operation call to called operation in activity .exml file
+    CALLED_RELATION_LINE = "<LINK relation=\"Called\">"
+    # number of lines between called operation relation and line with operation details
+    CALLED_OPERATION_ID_OFFSET = 2
+    # size of chunk read from .exml file during byte scan
+    SCAN_CHUNK_SIZE = 65536
+
+    # possible states of module and activity finder
     NO_MORE_FILES = 10
     FILE_NOT_FOUND = 20
     FILE_FOUND = 30
 
-    # return data
-    module_file = []
-    module_name = ""
-    module_uid = ""
-    activity_file = []
-    activity_name = ""
-    activity_uid = ""
-
     # indexes of return data
     FILES_FOUND_INDEX = 0
     MODULE_FILE_INDEX = 1
@@ -69,211 +92,628 @@ class FileFinder(object):
     ACTIVITY_FILE_INDEX = 4
     ACTIVITY_NAME_INDEX = 5
     ACTIVITY_UID_INDEX = 6
+    MODULE_SOURCE_PATH_INDEX = 7
+    ACTIVITY_SOURCE_PATH_INDEX = 8
 
     # Description:
-    # This method sets paths to .exml files, that describe model content.
-    @staticmethod
-    def set_model_dir_path(model_dir_path):
-
-        # get activity directory path
-        activity_dir_path = model_dir_path + str("\\Standard.Activity")
-        # get list of activity sources, i.e. names of .exml files
-        activity_source_list = listdir(activity_dir_path)
-        # get list of activity source paths
-        for activity_source in activity_source_list:
-            # get activity source path
-            FileFinder.activity_source_path_list.append(activity_dir_path + str("\\") + str(activity_source))
-
-        # get component directory path
-        component_dir_path = model_dir_path + str("\\Standard.Component")
-        # get list of component sources, i.e. names of .exml files
-        component_source_list = listdir(component_dir_path)
-        # get list of component source paths
-        component_source_path_list = []
-        for component_source in component_source_list:
-            # get component source path
-            component_source_path_list.append(component_dir_path + str("\\") + str(component_source))
-
-        # get package directory path
-        package_dir_path = model_dir_path + str("\\Standard.Package")
-        # get list of package sources, i.e. names of .exml files
-        package_source_list = listdir(package_dir_path)
-        # get list of package source paths
-        package_source_path_list = []
-        for package_source in package_source_list:
-            # get package source path
-            package_source_path_list.append(package_dir_path + str("\\") + str(package_source))
-
-        # get list of module source paths
-        FileFinder.module_source_path_list = component_source_path_list + package_source_path_list
+    # This is class constructor, which sets path to model directory and indexes .exml files, that describe
+    # model content. When list of module names or uids is given, only these modules and modules called by them
+    # are found, once they are selected.
+    def __init__(self, model_dir_path, module_key_list):
+
+        # initialize object data
+        self.model_dir_path = model_dir_path
+        self.module_key_list = module_key_list
+        # lists of activity and module .exml files, where each entry is [source path, file size, file modification time]
+        self.activity_source_path_list = []
+        self.module_source_path_list = []
+        # source path -> entry of activity or module .exml file
+        self.source_path_dict = {}
+        self.number_of_activity_files = 0
+        self.number_of_module_files = 0
+        self.module_index = 0
+
+        # model index, built when object is created and rebuilt when model changes
+        # list of uids of modules with operation definition, kept in order of module .exml files
+        self.module_uid_list = []
+        # module uid -> [module source path, module name]
+        self.module_source_path_dict = {}
+        # (parent module name, parent module uid) -> [activity source path, activity name, activity uid]
+        self.activity_source_path_dict = {}
+
+        # classes of .exml files found during last indexing, kept so unchanged files are not classified again,
+        # source path -> [file key, file class list, operation uid set], where operation uid set is none until
+        # uids of operations defined in module file or called from activity file are read
+        self.file_class_dict = {}
+
+        # module and activity finder state
+        self.module_finder_state = 0
+        self.activity_finder_state = 0
+
+        # return data
+        self.module_file = []
+        self.module_name = ""
+        self.module_uid = ""
+        self.module_source_path = ""
+        self.activity_file = []
+        self.activity_name = ""
+        self.activity_uid = ""
+        self.activity_source_path = ""
+
+        # index model files
+        self.index_model()
+
+    # Description:
+    # This method returns entries of all .exml files found in given model catalog, i.e. their paths together with
+    # size and modification time taken from directory scan, so files do not need to be opened to find them.
+    def get_source_path_list(self, catalog_name):
+
+        # get catalog directory path
+        catalog_dir_path = join(self.model_dir_path, catalog_name)
+        # list of catalog source entries
+        catalog_source_path_list = []
+
+        # go through all catalog entries
+        with scandir(catalog_dir_path) as catalog_entry_iterator:
+            for catalog_entry in catalog_entry_iterator:
+
+                try:
+                    # if entry is regular .exml file
+                    if catalog_entry.name.endswith(".exml") and catalog_entry.is_file():
+                        # get file status, which is cached by directory scan where the system allows
+                        file_stat = catalog_entry.stat()
+                        # append collected data to source entry
+                        source_entry = []
+                        source_entry.insert(FileFinder.FILE_PATH_INDEX, catalog_entry.path)
+                        source_entry.insert(FileFinder.FILE_SIZE_INDEX, file_stat.st_size)
+                        source_entry.insert(FileFinder.FILE_MTIME_INDEX, file_stat.st_mtime_ns)
+                        catalog_source_path_list.append(source_entry)
+
+                except OSError:
+                    # file has been removed after catalog was scanned, therefore it is skipped
+                    pass
+
+        # return list of catalog source entries
+        return catalog_source_path_list
+
+    # Description:
+    # This method sets paths to .exml files, that describe model content, and indexes module and activity files.
+    # Classes of files, which have not changed since previous indexing, are reused.
+    def index_model(self):
+
+        # get list of activity source entries
+        self.activity_source_path_list = self.get_source_path_list("Standard.Activity")
+
+        # get list of module source entries
+        self.module_source_path_list = self.get_source_path_list("Standard.Component") + \
+            self.get_source_path_list("Standard.Package")
+
+        # map source paths to source entries
+        self.source_path_dict = {}
+        for source_entry in self.activity_source_path_list + self.module_source_path_list:
+            self.source_path_dict[source_entry[FileFinder.FILE_PATH_INDEX]] = source_entry
 
         # get number of activity .exml files
-        FileFinder.number_of_activity_files = len(FileFinder.activity_source_path_list)
+        self.number_of_activity_files = len(self.activity_source_path_list)
 
         # get number of module .exml files
-        FileFinder.number_of_module_files = len(FileFinder.module_source_path_list)
+        self.number_of_module_files = len(self.module_source_path_list)
+
+        # clear model index and start search from first module
+        self.module_uid_list = []
+        self.module_source_path_dict = {}
+        self.activity_source_path_dict = {}
+        self.module_index = 0
+
+        # keep classes of files from previous indexing, so only new and changed files are classified
+        previous_file_class_dict = self.file_class_dict
+        self.file_class_dict = {}
+
+        # index module and activity files, so each .exml file is read only once during search
+        self.index_module_files(previous_file_class_dict)
+        self.index_activity_files(previous_file_class_dict)
 
     # Description:
-    # This method clears data, that represents module details.
+    # This method returns key of .exml file found during last indexing, i.e. its modification time and size,
+    # which changes whenever content of the file changes.
+    def get_file_key(self, source_path):
+
+        # get source entry
+        source_entry = self.source_path_dict[source_path]
+
+        # return file key
+        return source_entry[FileFinder.FILE_MTIME_INDEX], source_entry[FileFinder.FILE_SIZE_INDEX]
+
+    # Description:
+    # This method returns size of .exml file found during last indexing.
+    def get_file_size(self, source_path):
+
+        # return file size
+        return self.source_path_dict[source_path][FileFinder.FILE_SIZE_INDEX]
+
+    # Description:
+    # This method returns state of model, i.e. modification time and size of each .exml file in model catalogs,
+    # which changes whenever any .exml file is added, removed or modified.
+    def get_model_state(self):
+
+        # model state, source path -> file key
+        model_state_dict = {}
+
+        # go through all model catalogs
+        for catalog_name in ["Standard.Activity", "Standard.Component", "Standard.Package"]:
+            # go through all source entries in catalog
+            for source_entry in self.get_source_path_list(catalog_name):
+                # store file key
+                model_state_dict[source_entry[FileFinder.FILE_PATH_INDEX]] = \
+                    (source_entry[FileFinder.FILE_MTIME_INDEX], source_entry[FileFinder.FILE_SIZE_INDEX])
+
+        # return model state
+        return model_state_dict
+
+    # Description:
+    # This method reads .exml file and returns its content as sequence of stripped lines. The file is mapped in
+    # memory and lines are decoded when they are accessed, so content is not copied into list of lines.
     @staticmethod
-    def clear_return_data():
+    def read_file(source_path):
+
+        # map file in memory and find its lines
+        source_file = FileLines(source_path)
+
+        # return file content
+        return source_file
+
+    # Description:
+    # This method releases content of module and activity .exml files pointed by file finder list, so the content
+    # is not kept in memory for the rest of module conversion. Files, which have not been read, e.g. when reading
+    # has been stopped by error, are skipped.
+    @staticmethod
+    def close_files(file_finder_list):
+
+        # go through module and activity file
+        for file_index in [FileFinder.MODULE_FILE_INDEX, FileFinder.ACTIVITY_FILE_INDEX]:
+            # if file has been read
+            if isinstance(file_finder_list[file_index], FileLines):
+                # release file
+                file_finder_list[file_index].close()
+            file_finder_list[file_index] = []
+
+    # Description:
+    # This method reads header of .exml file, i.e. line with <ID> element that owns the file and following line
+    # with <PID> element of its parent, without reading the rest of file content.
+    @staticmethod
+    def read_file_header(source_path):
+
+        # header lines
+        element_line = ""
+        parent_line = ""
+
+        # open file and read lines until first <ID> element is found, then close file
+        file_disk = open(source_path, "r")
+        for line in file_disk:
+            # if owning element is found
+            if "<ID name=" in line:
+                # get element line and parent line
+                element_line = line.strip()
+                parent_line = file_disk.readline().strip()
+                # exit 'for line in' loop
+                break
+        file_disk.close()
+
+        # return header lines
+        return element_line, parent_line
+
+    # Description:
+    # This method checks if .exml file contains given marker, basing on byte scan of file content.
+    @staticmethod
+    def scan_file(source_path, marker):
+
+        # assume that marker is not found
+        marker_found = False
+        # end of previous chunk, required to find marker split between two chunks
+        previous_chunk_end = b""
+
+        # open file and scan chunks until marker is found, then close file
+        file_disk = open(source_path, "rb")
+        while not marker_found:
+            # get next chunk
+            chunk = file_disk.read(FileFinder.SCAN_CHUNK_SIZE)
+            # if end of file is reached
+            if not chunk:
+                # exit 'while not' loop
+                break
+            # join chunk with end of previous chunk and check if marker is there
+            chunk = previous_chunk_end + chunk
+            marker_found = marker in chunk
+            # store end of chunk
+            previous_chunk_end = chunk[-len(marker)+1:]
+        file_disk.close()
+
+        # return result
+        return marker_found
+
+    # Description:
+    # This method reads uid of operation defined in module .exml file, without reading the rest of file content.
+    @staticmethod
+    def read_operation_uid(source_path):
+
+        # operation uid
+        operation_uid = "UNKNOWN"
+        # number of lines left to line with operation details, or -1 before operation definition is found
+        lines_left = -1
+
+        # open file and read lines until operation uid is found, then close file
+        file_disk = open(source_path, "r")
+        for line in file_disk:
+            # if line with operation details is reached
+            if lines_left == 0:
+                # get operation uid
+                operation_uid = FileSupporter.get_element_id(line.strip())[2]
+                # exit 'for line in' loop
+                break
+            # if operation definition is found
+            elif lines_left < 0 and "<COMP relation=\"OwnedOperation\">" in line:
+                lines_left = FileFinder.OPERATION_ID_OFFSET
+            lines_left = lines_left - 1
+        file_disk.close()
+
+        # return operation uid
+        return operation_uid
+
+    # Description:
+    # This method reads uids of operations called from activity .exml file, i.e. uids of operations referred
+    # by Called relation of CallOperationAction elements. Names of CallOperationAction elements are not used,
+    # since they can be changed in model without change of called operation.
+    @staticmethod
+    def read_called_operation_uids(source_path):
+
+        # set of called operation uids
+        operation_uid_set = set()
+
+        # read file and classify its lines
+        source_file = FileFinder.read_file(source_path)
+        line_class_list = FileParser.classify_lines(source_file)
+
+        # go through lines with relation start
+        for line_index in line_class_list[FileParser.LINE_POSITION_LIST_INDEX][FileParser.RELATION_START_LINE]:
+            # get position of line with details of referred element
+            id_line_index = line_index + FileFinder.CALLED_OPERATION_ID_OFFSET
+
+            # if called operation is found
+            if source_file[line_index] == FileFinder.CALLED_RELATION_LINE and \
+                    id_line_index < len(source_file) and \
+                    "mc=\"Standard.Operation\"" in source_file[id_line_index]:
+                # add operation uid to set
+                operation_uid_set.add(FileSupporter.get_element_id(source_file[id_line_index])[2])
+
+        # release file content
+        source_file.close()
+
+        # return set of called operation uids
+        return operation_uid_set
+
+    # Description:
+    # This method classifies .exml file basing on its header, i.e. checks whether the file describes module with
+    # operation definition, activity owned by module or other element.
+    @staticmethod
+    def classify_file(source_path):
+
+        # assume that file describes other element
+        file_class = FileFinder.OTHER_FILE
+        element_name = "UNKNOWN"
+        element_uid = "UNKNOWN"
+        parent_name = "UNKNOWN"
+        parent_uid = "UNKNOWN"
+
+        # get header lines
+        element_line, parent_line = FileFinder.read_file_header(source_path)
+
+        # if element has parent
+        if "<ID name=" in element_line and "<PID name=" in parent_line:
+            # get element and parent details
+            element_name, element_class, element_uid = FileSupporter.get_element_id(element_line)
+            parent_name, parent_class, parent_uid = FileSupporter.get_element_id(parent_line)
+
+            # if element is module with operation definition
+            if (element_class == "Standard.Component" or element_class == "Standard.Package") and \
+                    FileFinder.scan_file(source_path, FileFinder.OWNED_OPERATION_MARKER):
+                # set module class
+                file_class = FileFinder.MODULE_FILE
+
+            # if element is activity owned by module
+            elif element_class == "Standard.Activity" and \
+                    (parent_class == "Standard.Component" or parent_class == "Standard.Package"):
+                # set activity class
+                file_class = FileFinder.ACTIVITY_FILE
+
+        # append collected data to file class list
+        file_class_list = []
+        file_class_list.insert(FileFinder.FILE_CLASS_INDEX, file_class)
+        file_class_list.insert(FileFinder.ELEMENT_NAME_INDEX, element_name)
+        file_class_list.insert(FileFinder.ELEMENT_UID_INDEX, element_uid)
+        file_class_list.insert(FileFinder.PARENT_NAME_INDEX, parent_name)
+        file_class_list.insert(FileFinder.PARENT_UID_INDEX, parent_uid)
+
+        # return file class list
+        return file_class_list
+
+    # Description:
+    # This method returns class of .exml file, reusing class from previous indexing if the file has not changed.
+    def get_file_class(self, source_path, previous_file_class_dict):
+
+        # get file key, i.e. modification time and size of file
+        file_key = self.get_file_key(source_path)
+
+        # if file has not changed since previous indexing
+        if source_path in previous_file_class_dict and \
+                previous_file_class_dict[source_path][FileFinder.FILE_KEY_INDEX] == file_key:
+            # reuse file class, together with operation names if they have been read
+            file_class_entry = previous_file_class_dict[source_path]
+        else:
+            # classify file
+            file_class_entry = [file_key, FileFinder.classify_file(source_path), None]
+
+        # remember file class for next indexing
+        self.file_class_dict[source_path] = file_class_entry
+
+        # return file class list
+        return file_class_entry[FileFinder.FILE_CLASS_LIST_INDEX]
+
+    # Description:
+    # This method returns set of uids of operations defined in module .exml file or called from activity .exml
+    # file. The uids are read once for each version of the file and reused by next indexing.
+    def get_operation_uids(self, source_path):
+
+        # get file class entry and file class
+        file_class_entry = self.file_class_dict[source_path]
+        file_class = file_class_entry[FileFinder.FILE_CLASS_LIST_INDEX][FileFinder.FILE_CLASS_INDEX]
+
+        # if operation uids have not been read yet
+        if file_class_entry[FileFinder.OPERATION_UID_SET_INDEX] is None:
+            # if file describes module
+            if file_class == FileFinder.MODULE_FILE:
+                # read uid of defined operation
+                file_class_entry[FileFinder.OPERATION_UID_SET_INDEX] = {FileFinder.read_operation_uid(source_path)}
+            else:
+                # read uids of called operations
+                file_class_entry[FileFinder.OPERATION_UID_SET_INDEX] = \
+                    FileFinder.read_called_operation_uids(source_path)
+
+        # return set of operation uids
+        return file_class_entry[FileFinder.OPERATION_UID_SET_INDEX]
+
+    # Description:
+    # This method indexes module .exml files, i.e. maps uid of each module with operation definition
+    # to module source path and name.
+    def index_module_files(self, previous_file_class_dict):
+
+        # go through all module source entries
+        for module_source_entry in self.module_source_path_list:
+
+            # get module source path
+            module_source_path = module_source_entry[FileFinder.FILE_PATH_INDEX]
+
+            # classify module file
+            file_class_list = self.get_file_class(module_source_path, previous_file_class_dict)
+
+            # if operation is defined in module
+            if file_class_list[FileFinder.FILE_CLASS_INDEX] == FileFinder.MODULE_FILE:
+                # get module name and uid
+                module_name = file_class_list[FileFinder.ELEMENT_NAME_INDEX]
+                module_uid = file_class_list[FileFinder.ELEMENT_UID_INDEX]
+                # append module to module index
+                self.module_uid_list.append(module_uid)
+                self.module_source_path_dict[module_uid] = [module_source_path, module_name]
+
+    # Description:
+    # This method indexes activity .exml files, i.e. maps name and uid of parent module to activity source path,
+    # activity name and uid.
+    def index_activity_files(self, previous_file_class_dict):
+
+        # go through all activity source entries
+        for activity_source_entry in self.activity_source_path_list:
+
+            # get activity source path
+            activity_source_path = activity_source_entry[FileFinder.FILE_PATH_INDEX]
+
+            # classify activity file
+            file_class_list = self.get_file_class(activity_source_path, previous_file_class_dict)
+
+            # if activity is owned by module
+            if file_class_list[FileFinder.FILE_CLASS_INDEX] == FileFinder.ACTIVITY_FILE:
+                # get activity name and uid
+                activity_name = file_class_list[FileFinder.ELEMENT_NAME_INDEX]
+                activity_uid = file_class_list[FileFinder.ELEMENT_UID_INDEX]
+                # get parent module key
+                parent_module_key = (file_class_list[FileFinder.PARENT_NAME_INDEX],
+                                     file_class_list[FileFinder.PARENT_UID_INDEX])
+                # append activity to activity index, unless other activity was already found for given module
+                if parent_module_key not in self.activity_source_path_dict:
+                    self.activity_source_path_dict[parent_module_key] = [activity_source_path,
+                                                                               activity_name,
+                                                                               activity_uid]
+
+    # Description:
+    # This method selects modules, given by name or uid, and modules whose operations they call, directly or
+    # through other modules. Other modules are removed from model index, so they are not found during search.
+    def select_modules(self):
+
+        # record info
+        Logger.save_in_log_file("FileFinder", "Selecting requested modules and modules called by them", True)
+
+        # map operation uids to uids of modules, which define the operations
+        operation_module_uid_dict = {}
+        for module_uid in self.module_uid_list:
+            # get module source path
+            module_source_path = self.module_source_path_dict[module_uid][FileFinder.SOURCE_PATH_INDEX]
+            # go through uids of operations defined in module
+            for operation_uid in self.get_operation_uids(module_source_path):
+                # append module uid to operation entry
+                if operation_uid not in operation_module_uid_dict:
+                    operation_module_uid_dict[operation_uid] = []
+                operation_module_uid_dict[operation_uid].append(module_uid)
+
+        # list of uids of selected modules, in order of selection, and set of the same uids
+        selected_module_uid_list = []
+        selected_module_uid_set = set()
+
+        # go through all requested modules
+        for module_key in self.module_key_list:
+
+            # flag to distinguish if requested module has been found
+            module_found = False
+
+            # search for module with given name or uid
+            for module_uid in self.module_uid_list:
+                if module_key == module_uid or \
+                        module_key == self.module_source_path_dict[module_uid][FileFinder.SOURCE_NAME_INDEX]:
+                    # set found flag
+                    module_found = True
+                    # select module, unless it is already selected
+                    if module_uid not in selected_module_uid_set:
+                        selected_module_uid_list.append(module_uid)
+                        selected_module_uid_set.add(module_uid)
+
+            # if requested module has not been found
+            if not module_found:
+                # record error
+                ErrorHandler.record_error(ErrorHandler.FIND_ERR_REQUESTED_MODULE_NOT_FOUND, module_key, "")
+
+        # go through selected modules, including modules selected during the search
+        i = 0
+        while i < len(selected_module_uid_list):
+
+            # get module details
+            module_uid = selected_module_uid_list[i]
+            module_name = self.module_source_path_dict[module_uid][FileFinder.SOURCE_NAME_INDEX]
+            # record info
+            Logger.save_in_log_file("FileFinder", "Have selected module " + module_name + " " + module_uid, False)
+
+            # get parent module key
+            parent_module_key = (module_name, module_uid)
+
+            # if activity of module exists
+            if parent_module_key in self.activity_source_path_dict:
+                # get activity source path
+                activity_source_path = self.activity_source_path_dict[parent_module_key][FileFinder.SOURCE_PATH_INDEX]
+
+                # go through all called operations, sorted so modules are always selected in the same order
+                for operation_uid in sorted(self.get_operation_uids(activity_source_path)):
+                    # if operation is defined by any module
+                    if operation_uid in operation_module_uid_dict:
+                        # select modules that define the operation, unless they are already selected
+                        for called_module_uid in operation_module_uid_dict[operation_uid]:
+                            if called_module_uid not in selected_module_uid_set:
+                                selected_module_uid_list.append(called_module_uid)
+                                selected_module_uid_set.add(called_module_uid)
+
+            i = i + 1
+
+        # keep only selected modules in model index, in order of module .exml files
+        self.module_uid_list = [module_uid for module_uid in self.module_uid_list
+                                if module_uid in selected_module_uid_set]
+
+    # Description:
+    # This method clears data, that represents module details.
+    def clear_return_data(self):
 
         # clear return data
-        FileFinder.module_file = []
-        FileFinder.module_name = "UNKNOWN_MODULE_NAME"
-        FileFinder.module_uid = "UNKNOWN_MODULE_UID"
-        FileFinder.activity_file = []
-        FileFinder.activity_name = "UNKNOWN_ACTIVITY_NAME"
-        FileFinder.activity_uid = "UNKNOWN_ACTIVITY_UID"
+        self.module_file = []
+        self.module_name = "UNKNOWN_MODULE_NAME"
+        self.module_uid = "UNKNOWN_MODULE_UID"
+        self.module_source_path = ""
+        self.activity_file = []
+        self.activity_name = "UNKNOWN_ACTIVITY_NAME"
+        self.activity_uid = "UNKNOWN_ACTIVITY_UID"
+        self.activity_source_path = ""
 
     # Description:
     # This method looks for .exml files, that represent module element with operation definition
-    @staticmethod
-    def find_module_file():
+    def find_module_file(self):
 
         # record info
         Logger.save_in_log_file("FileFinder", "Looking for module .exml file", False)
 
-        # assume that module with operation definition is not found
-        FileFinder.module_finder_state = FileFinder.FILE_NOT_FOUND
-
-        # repeat as long as file is not found
-        while FileFinder.module_finder_state == FileFinder.FILE_NOT_FOUND:
-
-            # if all modules have not been checked yet
-            if FileFinder.module_index < FileFinder.number_of_module_files:
-                # get module source path
-                module_source_path = FileFinder.module_source_path_list[FileFinder.module_index]
-
-                # open file and read content, then close file
-                module_file_disk = open(module_source_path, "r")
-                module_file = module_file_disk.readlines()
-                module_file = [line.strip() for line in module_file]
-                module_file_disk.close()
-
-                # increment module index
-                FileFinder.module_index = FileFinder.module_index + 1
-
-                # check if module contains operation definition
-                for i in range(0, len(module_file)):
-
-                    # if module name if found
-                    if ("<ID name=" in module_file[i] and
-                            ("mc=\"Standard.Component\"" in module_file[i] or
-                             "mc=\"Standard.Package\"" in module_file[i]) and
-                            "<PID name=" in module_file[i+1]):
-                        # get module name
-                        FileFinder.module_name = FileSupporter.get_name(module_file[i])
-                        # get module uid
-                        FileFinder.module_uid = FileSupporter.get_uid(module_file[i])
-
-                    # if operation is defined in module
-                    if "<COMP relation=\"OwnedOperation\">" in module_file[i]:
-                        # store module file
-                        FileFinder.module_file = module_file
-                        # set module finder state
-                        FileFinder.module_finder_state = FileFinder.FILE_FOUND
-                        # record info
-                        Logger.save_in_log_file("FileFinder",
-                                                "Have found module " + FileFinder.module_name + " "
-                                                + FileFinder.module_uid + ".exml file", False)
-                        # exit 'for i in range' loop
-                        break
+        # if all modules have not been checked yet
+        if self.module_index < len(self.module_uid_list):
+            # get next module from module index
+            module_uid = self.module_uid_list[self.module_index]
+            module_source_path = self.module_source_path_dict[module_uid][FileFinder.SOURCE_PATH_INDEX]
+            module_name = self.module_source_path_dict[module_uid][FileFinder.SOURCE_NAME_INDEX]
+
+            # increment module index
+            self.module_index = self.module_index + 1
+
+            # store module details
+            self.module_name = module_name
+            self.module_uid = module_uid
+            self.module_source_path = module_source_path
+            # set module finder state
+            self.module_finder_state = FileFinder.FILE_FOUND
+            # record info
+            Logger.save_in_log_file("FileFinder",
+                                    "Have found module " + self.module_name + " "
+                                    + self.module_uid + ".exml file", False)
 
-            else:
-                # all modules have been checked already
-                FileFinder.module_finder_state = FileFinder.NO_MORE_FILES
-                # record info
-                Logger.save_in_log_file("FileFinder", "No further .exml files have been found", False)
+        else:
+            # all modules have been checked already
+            self.module_finder_state = FileFinder.NO_MORE_FILES
+            # record info
+            Logger.save_in_log_file("FileFinder", "No further .exml files have been found", False)
 
     # Description:
     # This method looks for .exml files, that represent activity element for module operation
-    @staticmethod
-    def find_activity_file():
+    def find_activity_file(self):
 
         # record info
         Logger.save_in_log_file("FileFinder", "Looking for activity .exml file", False)
 
-        # assume that activity for module operation is not found
-        FileFinder.activity_finder_state = FileFinder.FILE_NOT_FOUND
-
-        # reset activity index
-        FileFinder.activity_index = 0
-
-        # repeat as long as file is not found
-        while FileFinder.activity_finder_state == FileFinder.FILE_NOT_FOUND:
+        # get parent module key
+        parent_module_key = (self.module_name, self.module_uid)
+
+        # if activity for module operation is found in activity index
+        if parent_module_key in self.activity_source_path_dict:
+            # get activity details
+            activity_entry = self.activity_source_path_dict[parent_module_key]
+
+            # store activity details
+            self.activity_name = activity_entry[FileFinder.SOURCE_NAME_INDEX]
+            self.activity_uid = activity_entry[FileFinder.SOURCE_UID_INDEX]
+            self.activity_source_path = activity_entry[FileFinder.SOURCE_PATH_INDEX]
+            # set activity finder state
+            self.activity_finder_state = FileFinder.FILE_FOUND
+            # record info
+            Logger.save_in_log_file("FileFinder",
+                                    "Have found activity " + self.activity_name + " "
+                                    + self.activity_uid + ".exml file", False)
 
-            # if all activities have not been checked yet
-            if FileFinder.activity_index < FileFinder.number_of_activity_files:
-                # get activity source path
-                activity_source_path = FileFinder.activity_source_path_list[FileFinder.activity_index]
-
-                # open file and read content, then close file
-                activity_file_disk = open(activity_source_path, "r")
-                activity_file = activity_file_disk.readlines()
-                activity_file = [line.strip() for line in activity_file]
-                activity_file_disk.close()
-
-                # increment activity index
-                FileFinder.activity_index = FileFinder.activity_index + 1
-
-                # check if activity file belongs to module with operation
-                for i in range(0, len(activity_file)):
-
-                    # if activity name if found
-                    if ("<ID name=" in activity_file[i] and "mc=\"Standard.Activity\"" in activity_file[i] and
-                            "<PID name=" in activity_file[i + 1] and
-                            ("mc=\"Standard.Component\"" in activity_file[i+1] or
-                             "mc=\"Standard.Package\"" in activity_file[i+1])):
-                        # get activity name
-                        FileFinder.activity_name = FileSupporter.get_name(activity_file[i])
-                        # get activity uid
-                        FileFinder.activity_uid = FileSupporter.get_uid(activity_file[i])
-                        # get parent module name
-                        parent_module_name = FileSupporter.get_name(activity_file[i+1])
-                        # get parent module uid
-                        parent_module_uid = FileSupporter.get_uid(activity_file[i+1])
-                        # if there is name and uid compatibility
-                        if FileFinder.module_name == parent_module_name and FileFinder.module_uid == parent_module_uid:
-                            # store activity file
-                            FileFinder.activity_file = activity_file
-                            # set activity finder state
-                            FileFinder.activity_finder_state = FileFinder.FILE_FOUND
-                            # record info
-                            Logger.save_in_log_file("FileFinder",
-                                                    "Have found activity " + FileFinder.activity_name + " "
-                                                    + FileFinder.activity_uid + ".exml file", False)
-                            # exit 'for i in range' loop
-                            break
-            else:
-                # all activities have been checked already
-                FileFinder.activity_finder_state = FileFinder.NO_MORE_FILES
-                # record info
-                Logger.save_in_log_file("FileFinder", "No further .exml files have been found", False)
+        else:
+            # activity for module operation does not exist
+            self.activity_finder_state = FileFinder.NO_MORE_FILES
+            # record info
+            Logger.save_in_log_file("FileFinder", "No further .exml files have been found", False)
 
     # Description:
-    # This method looks for set of .exml files, which describe entire content of one model element
+    # This method looks for paths to set of .exml files, which describe entire content of one model element
     # (either component or package element), i.e. activity diagram and related interface elements.
-    @staticmethod
-    def find_files():
+    def find_file_paths(self):
 
         # record info
         Logger.save_in_log_file("FileFinder", "Searching for set of .exml files that describe module details", True)
 
         # clear data before search
-        FileFinder.clear_return_data()
+        self.clear_return_data()
 
         # find module file
-        FileFinder.find_module_file()
+        self.find_module_file()
 
         # only when module file has been found
-        if FileFinder.module_finder_state == FileFinder.FILE_FOUND:
+        if self.module_finder_state == FileFinder.FILE_FOUND:
             # find activity file
-            FileFinder.find_activity_file()
+            self.find_activity_file()
 
         # if module and activity files have been found
-        if (FileFinder.module_finder_state == FileFinder.FILE_FOUND and
-                FileFinder.activity_finder_state == FileFinder.FILE_FOUND):
+        if (self.module_finder_state == FileFinder.FILE_FOUND and
+                self.activity_finder_state == FileFinder.FILE_FOUND):
             # set positive flag
             files_found = True
 
@@ -281,17 +721,32 @@ class FileFinder(object):
             # set negative flag
             files_found = False
             # clear again data before return
-            FileFinder.clear_return_data()
+            self.clear_return_data()
 
         # append collected data to file finder list
         file_finder_list = []
         file_finder_list.insert(FileFinder.FILES_FOUND_INDEX, files_found)
-        file_finder_list.insert(FileFinder.MODULE_FILE_INDEX, FileFinder.module_file)
-        file_finder_list.insert(FileFinder.MODULE_NAME_INDEX, FileFinder.module_name)
-        file_finder_list.insert(FileFinder.MODULE_UID_INDEX, FileFinder.module_uid)
-        file_finder_list.insert(FileFinder.ACTIVITY_FILE_INDEX, FileFinder.activity_file)
-        file_finder_list.insert(FileFinder.ACTIVITY_NAME_INDEX, FileFinder.activity_name)
-        file_finder_list.insert(FileFinder.ACTIVITY_UID_INDEX, FileFinder.activity_uid)
+        file_finder_list.insert(FileFinder.MODULE_FILE_INDEX, self.module_file)
+        file_finder_list.insert(FileFinder.MODULE_NAME_INDEX, self.module_name)
+        file_finder_list.insert(FileFinder.MODULE_UID_INDEX, self.module_uid)
+        file_finder_list.insert(FileFinder.ACTIVITY_FILE_INDEX, self.activity_file)
+        file_finder_list.insert(FileFinder.ACTIVITY_NAME_INDEX, self.activity_name)
+        file_finder_list.insert(FileFinder.ACTIVITY_UID_INDEX, self.activity_uid)
+        file_finder_list.insert(FileFinder.MODULE_SOURCE_PATH_INDEX, self.module_source_path)
+        file_finder_list.insert(FileFinder.ACTIVITY_SOURCE_PATH_INDEX, self.activity_source_path)
 
         # return file finder list
         return file_finder_list
+
+    # Description:
+    # This method reads content of module and activity .exml files pointed by file finder list.
+    @staticmethod
+    def read_files(file_finder_list):
+
+        # if module and activity files have been found
+        if file_finder_list[FileFinder.FILES_FOUND_INDEX]:
+            # read module and activity file
+            file_finder_list[FileFinder.MODULE_FILE_INDEX] = \
+                FileFinder.read_file(file_finder_list[FileFinder.MODULE_SOURCE_PATH_INDEX])
+            file_finder_list[FileFinder.ACTIVITY_FILE_INDEX] = \
+                FileFinder.read_file(file_finder_list[FileFinder.ACTIVITY_SOURCE_PATH_INDEX])
@@ -0,0 +1,120 @@
+#   FILE:           mcg_cc_file_lines.py
+#
+#   DESCRIPTION:
+#       This module contains definition of FileLines class, which gives access
+#       to stripped lines of .exml file mapped in memory.
+#
+#   COPYRIGHT:      Copyright (C) 2021-2026 Kamil Deć github.com/deckamil
+#   DATE:           17 OCT 2026
+#
+#   LICENSE:
+#       This file is part of Mod Code Generator (MCG).
+#
+#       MCG is free software: you can redistribute it and/or modify
+#       it under the terms of the GNU General Public License as published by
+#       the Free Software Foundation, either version 3 of the License, or
+#       (at your option) any later version.
+#
+#       MCG is distributed in the hope that it will be useful,
+#       but WITHOUT ANY WARRANTY; without even the implied warranty of
+#       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#       GNU General Public License for more details.
+#
+#       Under Section 7 of GPL version 3, you are granted additional
+#       permissions described in the MCG Output Exception, version 1, which
+#       copy you should have received along with this program.
+#
+#       You should have received a copy of the GNU General Public License
+#       along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import mmap
+import re
+from array import array
+from locale import getpreferredencoding
+
+
+# Description:
+# This class allows to read .exml file as list of stripped lines without copying its content. The file is mapped
+# in memory and only positions of lines are stored, each line is decoded when it is accessed.
+class FileLines(object):
+
+    # pattern of end of line
+    LINE_END_PATTERN = re.compile(b"\n")
+
+    # Description:
+    # This is class constructor.
+    def __init__(self, source_path):
+        # initialize object data
+        self.source_path = source_path
+        # encoding used to decode lines, the same as in case of file opened in text mode
+        self.encoding = getpreferredencoding(False)
+        # file content mapped in memory
+        self.buffer = b""
+        # start positions of lines in buffer, followed by buffer size, so line of given index ends
+        # where next line starts
+        self.line_start_array = array("L")
+
+        # open file and map its content in memory, then close file, the map remains valid
+        file_disk = open(source_path, "rb")
+        try:
+            # empty file cannot be mapped
+            if file_disk.seek(0, 2) > 0:
+                self.buffer = mmap.mmap(file_disk.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            file_disk.close()
+
+        # find positions of lines
+        self.index_lines()
+
+    # Description:
+    # This method finds start position of each line in buffer.
+    def index_lines(self):
+
+        # get buffer size
+        buffer_size = len(self.buffer)
+
+        # if buffer is not empty, first line starts at its beginning
+        if buffer_size > 0:
+            self.line_start_array.append(0)
+        # each next line starts after new line character
+        self.line_start_array.extend(line_end.end()
+                                     for line_end in FileLines.LINE_END_PATTERN.finditer(self.buffer))
+
+        # if buffer ends with new line character, there is no line after it
+        if self.line_start_array and self.line_start_array[-1] == buffer_size:
+            self.line_start_array.pop()
+        # append buffer size as end of last line
+        self.line_start_array.append(buffer_size)
+
+    # Description:
+    # This method releases file content mapped in memory. Lines cannot be accessed afterwards.
+    def close(self):
+
+        # if file content is mapped
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self.buffer = b""
+        self.line_start_array = array("L", [0])
+
+    # Description:
+    # This method returns number of lines.
+    def __len__(self):
+        return len(self.line_start_array) - 1
+
+    # Description:
+    # This method returns stripped line of given index.
+    def __getitem__(self, line_index):
+        if line_index < 0:
+            line_index = line_index + len(self.line_start_array) - 1
+        if line_index < 0 or line_index >= len(self.line_start_array) - 1:
+            raise IndexError("line index out of range")
+        return self.buffer[self.line_start_array[line_index]:self.line_start_array[line_index + 1]].decode(
+            self.encoding).strip()
+
+    # Description:
+    # This method returns iterator over all stripped lines.
+    def __iter__(self):
+        for line_index in range(0, len(self.line_start_array) - 1):
+            yield self.buffer[self.line_start_array[line_index]:self.line_start_array[line_index + 1]].decode(
+                self.encoding).strip()
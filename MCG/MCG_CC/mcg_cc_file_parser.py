@@ -0,0 +1,446 @@
+#   FILE:           mcg_cc_file_parser.py
+#
+#   DESCRIPTION:
+#       This module contains definition of FileElement class, which represents
+#       model element described in .exml file, and FileParser class, which is
+#       responsible for building of model element tree from .exml file content.
+#
+#   COPYRIGHT:      Copyright (C) 2021-2026 Kamil Deć github.com/deckamil
+#   DATE:           17 OCT 2026
+#
+#   LICENSE:
+#       This file is part of Mod Code Generator (MCG).
+#
+#       MCG is free software: you can redistribute it and/or modify
+#       it under the terms of the GNU General Public License as published by
+#       the Free Software Foundation, either version 3 of the License, or
+#       (at your option) any later version.
+#
+#       MCG is distributed in the hope that it will be useful,
+#       but WITHOUT ANY WARRANTY; without even the implied warranty of
+#       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#       GNU General Public License for more details.
+#
+#       Under Section 7 of GPL version 3, you are granted additional
+#       permissions described in the MCG Output Exception, version 1, which
+#       copy you should have received along with this program.
+#
+#       You should have received a copy of the GNU General Public License
+#       along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+from array import array
+from mcg_cc_file_lines import FileLines
+from mcg_cc_file_supporter import FileSupporter
+
+# numpy is optional, it speeds up classification of lines of large .exml files
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Description:
+# This class represents model element described by <OBJECT> section of .exml file.
+class FileElement(object):
+
+    # Description:
+    # This is class constructor.
+    def __init__(self):
+        # initialize object data
+        self.name = "UNKNOWN"
+        self.uid = "UNKNOWN"
+        self.element_class = "UNKNOWN"
+        # index of <ID> line and index of </OBJECT> line of element in .exml file
+        self.index = 0
+        self.end_index = 0
+        # element, which owns this element, or none for top element of .exml file
+        self.parent = None
+        # attribute name -> <ATT> line
+        self.attribute_dict = {}
+        # relation -> list of elements owned by this element under given <COMP> relation
+        self.composition_dict = {}
+        # relation -> list of elements referred by this element under given <LINK> or <COMP> relation
+        self.reference_dict = {}
+
+    # Description:
+    # This method returns list of elements owned by this element under given relation.
+    def get_components(self, relation):
+
+        # if any element is owned under given relation
+        if relation in self.composition_dict:
+            # return list of owned elements
+            return self.composition_dict[relation]
+        else:
+            # return empty list
+            return []
+
+    # Description:
+    # This method returns list of elements referred by this element under given relation.
+    def get_references(self, relation):
+
+        # if any element is referred under given relation
+        if relation in self.reference_dict:
+            # return list of referred elements
+            return self.reference_dict[relation]
+        else:
+            # return empty list
+            return []
+
+    # Description:
+    # This method returns list of elements of given class owned by this element, regardless of relation name,
+    # in order of their appearance in .exml file.
+    def get_components_of_class(self, element_class):
+        return FileElement.select_elements_of_class(self.composition_dict, element_class)
+
+    # Description:
+    # This method returns list of elements of given class referred by this element, regardless of relation name,
+    # in order of their appearance in .exml file.
+    def get_references_of_class(self, element_class):
+        return FileElement.select_elements_of_class(self.reference_dict, element_class)
+
+    # Description:
+    # This method returns elements of given class from dictionary of relations, in order of their appearance
+    # in .exml file.
+    @staticmethod
+    def select_elements_of_class(relation_dict, element_class):
+
+        # list of elements
+        element_list = []
+
+        # collect elements of given class from all relations
+        for relation_element_list in relation_dict.values():
+            for element in relation_element_list:
+                if element.element_class == element_class:
+                    element_list.append(element)
+
+        # if elements of several relations are collected, restore their order
+        if len(relation_dict) > 1:
+            element_list.sort(key=lambda element: element.index)
+
+        # return list of elements
+        return element_list
+
+    # Description:
+    # This method returns string representation of FileElement class.
+    def __str__(self):
+        line = self.element_class + " " + self.name + " " + self.uid
+        return line
+
+
+# Description:
+# This class allows to build tree of model elements from content of .exml file in one pass over file lines.
+class FileParser(object):
+
+    # kinds of .exml file lines
+    OTHER_LINE = 0
+    ID_LINE = 1
+    ATT_LINE = 2
+    OBJECT_START_LINE = 3
+    OBJECT_END_LINE = 4
+    RELATION_START_LINE = 5
+    RELATION_END_LINE = 6
+    REFERENCE_START_LINE = 7
+    REFERENCE_END_LINE = 8
+    NUMBER_OF_LINE_KINDS = 9
+
+    # beginning of stripped line -> kind of line, lines with other beginning are of other kind
+    LINE_START_LENGTH = 5
+    LINE_KIND_DICT = {"<ID n": ID_LINE,
+                      "<ATT ": ATT_LINE,
+                      "<OBJE": OBJECT_START_LINE,
+                      "</OBJ": OBJECT_END_LINE,
+                      "<COMP": RELATION_START_LINE,
+                      "<LINK": RELATION_START_LINE,
+                      "</COM": RELATION_END_LINE,
+                      "</LIN": RELATION_END_LINE,
+                      "<REFO": REFERENCE_START_LINE,
+                      "</REF": REFERENCE_END_LINE}
+
+    # minimal number of lines of .exml file, which is classified with numpy, if numpy is available
+    NUMPY_MIN_LINES = 10000
+
+    # indexes of line class list
+    LINE_KIND_ARRAY_INDEX = 0
+    LINE_POSITION_LIST_INDEX = 1
+    ELEMENT_LINE_POSITION_LIST_INDEX = 2
+
+    # Description:
+    # This method classifies each line of .exml file content, i.e. list of stripped lines, once and returns
+    # line class list with array of line kinds, list of line positions for each kind of line and list of
+    # positions of all lines, which describe model elements, i.e. lines of other kind than OTHER_LINE.
+    @staticmethod
+    def classify_lines(source_file):
+
+        # if numpy is available and file mapped in memory is large enough to benefit from it
+        if numpy is not None and isinstance(source_file, FileLines) and \
+                len(source_file) >= FileParser.NUMPY_MIN_LINES:
+            # classify lines with numpy
+            return FileParser.classify_lines_with_numpy(source_file)
+
+        # get kind of each line
+        line_kind_dict = FileParser.LINE_KIND_DICT
+        line_start_length = FileParser.LINE_START_LENGTH
+        line_kind_array = array("B", [line_kind_dict.get(line[:line_start_length], FileParser.OTHER_LINE)
+                                      for line in source_file])
+
+        # positions of lines of each kind
+        line_position_list = [[] for kind in range(0, FileParser.NUMBER_OF_LINE_KINDS)]
+        # positions of lines, which describe model elements
+        element_line_position_list = []
+
+        # go through kinds of all lines
+        for line_index in range(0, len(line_kind_array)):
+            # get kind of line
+            kind = line_kind_array[line_index]
+            # append line position to positions of its kind
+            line_position_list[kind].append(line_index)
+            # if line describes model element
+            if kind != FileParser.OTHER_LINE:
+                element_line_position_list.append(line_index)
+
+        # append collected data to line class list
+        line_class_list = []
+        line_class_list.insert(FileParser.LINE_KIND_ARRAY_INDEX, line_kind_array)
+        line_class_list.insert(FileParser.LINE_POSITION_LIST_INDEX, line_position_list)
+        line_class_list.insert(FileParser.ELEMENT_LINE_POSITION_LIST_INDEX, element_line_position_list)
+
+        # return line class list
+        return line_class_list
+
+    # Description:
+    # This method classifies lines of .exml file mapped in memory in the same way as classify_lines method, but works
+    # on raw file content with numpy arrays, so lines are neither decoded nor visited one by one. First and last
+    # non-blank character of each line is found by moving all line boundaries at once, one character per step,
+    # then beginnings of stripped lines are compared with line markers. Only lines, which begin with non-ASCII
+    # character, are decoded and classified one by one, since strip method also removes Unicode whitespace.
+    @staticmethod
+    def classify_lines_with_numpy(source_file):
+
+        # get file content and boundaries of lines, i.e. start of each line followed by content size
+        content_array = numpy.frombuffer(source_file.buffer, dtype=numpy.uint8)
+        line_boundary_array = numpy.asarray(source_file.line_start_array).astype(numpy.int64)
+        line_start_array = line_boundary_array[:-1]
+        line_end_array = line_boundary_array[1:].copy()
+        # blank characters, i.e. ASCII characters removed by strip method
+        blank_array = numpy.zeros(256, dtype=bool)
+        blank_array[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+
+        # move start of each line to its first non-blank character, or to end of blank line
+        active_array = line_start_array < line_end_array
+        active_array[active_array] = blank_array[content_array[line_start_array[active_array]]]
+        while active_array.any():
+            line_start_array[active_array] = line_start_array[active_array] + 1
+            active_array = active_array & (line_start_array < line_end_array)
+            active_array[active_array] = blank_array[content_array[line_start_array[active_array]]]
+
+        # move end of each line after its last non-blank character
+        active_array = line_start_array < line_end_array
+        active_array[active_array] = blank_array[content_array[line_end_array[active_array] - 1]]
+        while active_array.any():
+            line_end_array[active_array] = line_end_array[active_array] - 1
+            active_array = active_array & (line_start_array < line_end_array)
+            active_array[active_array] = blank_array[content_array[line_end_array[active_array] - 1]]
+
+        # get beginning of each stripped line as one number, where characters beyond line end are zeros
+        line_key_array = numpy.zeros(len(line_start_array), dtype=numpy.uint64)
+        for offset in range(0, FileParser.LINE_START_LENGTH):
+            inside_array = line_start_array + offset < line_end_array
+            character_array = numpy.zeros(len(line_start_array), dtype=numpy.uint64)
+            character_array[inside_array] = content_array[line_start_array[inside_array] + offset]
+            line_key_array = line_key_array | (character_array << numpy.uint64(8 * offset))
+
+        # assume that all lines are of other kind
+        kind_array = numpy.zeros(len(line_start_array), dtype=numpy.uint8)
+
+        # for each line marker, set kind of lines which begin with the marker
+        for line_start in FileParser.LINE_KIND_DICT:
+            line_start_key = int.from_bytes(line_start.encode("ascii"), "little")
+            kind_array[line_key_array == numpy.uint64(line_start_key)] = FileParser.LINE_KIND_DICT[line_start]
+
+        # lines, which begin with non-ASCII character after blank characters, may begin with Unicode whitespace,
+        # e.g. no-break space, therefore such lines are decoded and classified in the same way as in classify_lines
+        non_ascii_array = line_start_array < line_end_array
+        non_ascii_array[non_ascii_array] = content_array[line_start_array[non_ascii_array]] >= 0x80
+        for line_index in numpy.flatnonzero(non_ascii_array).tolist():
+            kind_array[line_index] = FileParser.LINE_KIND_DICT.get(
+                source_file[line_index][:FileParser.LINE_START_LENGTH], FileParser.OTHER_LINE)
+
+        # get kind of each line
+        line_kind_array = array("B", kind_array.tobytes())
+
+        # positions of lines of each kind
+        line_position_list = [numpy.flatnonzero(kind_array == kind).tolist()
+                              for kind in range(0, FileParser.NUMBER_OF_LINE_KINDS)]
+        # positions of lines, which describe model elements
+        element_line_position_list = numpy.flatnonzero(kind_array != FileParser.OTHER_LINE).tolist()
+
+        # append collected data to line class list
+        line_class_list = []
+        line_class_list.insert(FileParser.LINE_KIND_ARRAY_INDEX, line_kind_array)
+        line_class_list.insert(FileParser.LINE_POSITION_LIST_INDEX, line_position_list)
+        line_class_list.insert(FileParser.ELEMENT_LINE_POSITION_LIST_INDEX, element_line_position_list)
+
+        # return line class list
+        return line_class_list
+
+    # Description:
+    # This method sets element details taken from <ID> line of .exml file.
+    @staticmethod
+    def read_element_id(element, line, line_index):
+
+        # set element details
+        element.name, element.element_class, element.uid = FileSupporter.get_element_id(line)
+        element.index = line_index
+
+    # Description:
+    # This method parses content of .exml file, i.e. list of stripped lines, and returns list of all elements
+    # defined by <OBJECT> sections, in order of their appearance in the file. Each element keeps its attributes,
+    # owned elements and referred elements, so the content does not need to be searched again.
+    @staticmethod
+    def parse_file(source_file):
+
+        # list of all elements in order of appearance
+        element_list = []
+        # elements of currently open <OBJECT> sections
+        element_stack = []
+        # relations of currently open <COMP> and <LINK> sections
+        relation_stack = []
+        # flag to distinguish if <ID> line of new <OBJECT> section is expected
+        element_id_expected = False
+        # flag to distinguish if <ID> lines refer to other elements
+        reference_open = False
+
+        # classify lines of file
+        line_class_list = FileParser.classify_lines(source_file)
+        line_kind_array = line_class_list[FileParser.LINE_KIND_ARRAY_INDEX]
+
+        # go through lines, which describe model elements
+        for line_index in line_class_list[FileParser.ELEMENT_LINE_POSITION_LIST_INDEX]:
+
+            # get line and its kind
+            line = source_file[line_index]
+            kind = line_kind_array[line_index]
+
+            # if line describes element details
+            if kind == FileParser.ID_LINE:
+
+                # if this is <ID> line of new <OBJECT> section
+                if element_id_expected:
+                    # set element details
+                    FileParser.read_element_id(element_stack[-1], line, line_index)
+                    element_id_expected = False
+
+                # if this is reference to other element
+                elif reference_open and element_stack and relation_stack:
+                    # new referred element instance
+                    reference = FileElement()
+                    FileParser.read_element_id(reference, line, line_index)
+
+                    # append referred element to references of current element
+                    if relation_stack[-1] not in element_stack[-1].reference_dict:
+                        element_stack[-1].reference_dict[relation_stack[-1]] = []
+                    element_stack[-1].reference_dict[relation_stack[-1]].append(reference)
+
+            # if attribute is found
+            elif kind == FileParser.ATT_LINE:
+                # if attribute belongs to element
+                if element_stack:
+                    # get attribute name
+                    attribute_name_start_position = len("<ATT name=\"")
+                    attribute_name_end_position = line.find("\"", attribute_name_start_position)
+                    attribute_name = line[attribute_name_start_position:attribute_name_end_position]
+                    # append attribute to attributes of current element
+                    element_stack[-1].attribute_dict[attribute_name] = line
+
+            # if new <OBJECT> section is found
+            elif kind == FileParser.OBJECT_START_LINE:
+
+                # new element instance
+                element = FileElement()
+
+                # if element is owned by other element
+                if element_stack and relation_stack:
+                    # set owning element and append element to its components
+                    element.parent = element_stack[-1]
+                    if relation_stack[-1] not in element.parent.composition_dict:
+                        element.parent.composition_dict[relation_stack[-1]] = []
+                    element.parent.composition_dict[relation_stack[-1]].append(element)
+
+                # append element to element list and open element section
+                element_list.append(element)
+                element_stack.append(element)
+                # expect <ID> line of the element
+                element_id_expected = True
+
+            # if end of <OBJECT> section is found
+            elif kind == FileParser.OBJECT_END_LINE:
+                # close element section
+                if element_stack:
+                    element_stack.pop().end_index = line_index
+                element_id_expected = False
+
+            # if new <COMP> or <LINK> section is found
+            elif kind == FileParser.RELATION_START_LINE:
+                # get relation name
+                relation_start_position = line.find("relation=\"") + len("relation=\"")
+                relation_end_position = line.find("\"", relation_start_position)
+                # open relation section
+                relation_stack.append(line[relation_start_position:relation_end_position])
+
+            # if end of <COMP> or <LINK> section is found
+            elif kind == FileParser.RELATION_END_LINE:
+                # close relation section
+                if relation_stack:
+                    relation_stack.pop()
+
+            # if references to other elements are found
+            elif kind == FileParser.REFERENCE_START_LINE:
+                reference_open = True
+
+            # if end of references to other elements is found
+            elif kind == FileParser.REFERENCE_END_LINE:
+                reference_open = False
+
+        # return list of all elements
+        return element_list
+
+    # Description:
+    # This method returns dictionary of elements from given element list, grouped by element class, so only
+    # elements of relevant class need to be visited. Each group keeps order of elements from element list.
+    @staticmethod
+    def group_elements(element_list):
+
+        # element class -> list of elements
+        element_class_dict = {}
+
+        # go through all elements
+        for element in element_list:
+            # append element to elements of its class
+            if element.element_class not in element_class_dict:
+                element_class_dict[element.element_class] = []
+            element_class_dict[element.element_class].append(element)
+
+        # return dictionary of elements
+        return element_class_dict
+
+    # Description:
+    # This method returns elements of given classes from dictionary of grouped elements, in order of their
+    # appearance in .exml file.
+    @staticmethod
+    def get_elements(element_class_dict, element_class_list):
+
+        # list of elements
+        element_list = []
+
+        # collect elements of each class
+        for element_class in element_class_list:
+            if element_class in element_class_dict:
+                element_list.extend(element_class_dict[element_class])
+
+        # if elements of several classes are collected, restore their order
+        if len(element_class_list) > 1:
+            element_list.sort(key=lambda element: element.index)
+
+        # return list of elements
+        return element_list
@@ -28,10 +28,11 @@
 #       along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
+from bisect import bisect_left, bisect_right
 from mcg_cc_activity_connection import ActivityConnection
 from mcg_cc_activity_layer import *
-from mcg_cc_file_supporter import FileSupporter
 from mcg_cc_file_finder import FileFinder
+from mcg_cc_file_parser import FileParser
 from mcg_cc_logger import Logger
 
 
@@ -44,6 +45,10 @@ class FileReader(object):
     DATA_ELEMENT_NAME_INDEX = 1
     DATA_ELEMENT_VALUE_INDEX = 2
 
+    # indexes of operation list
+    OPERATION_NAME_LIST_INDEX = 0
+    OPERATION_UID_LIST_INDEX = 1
+
     # indexes of return data
     OPERATION_NAME_INDEX = 0
     CONSTANT_LIST_INDEX = 1
@@ -60,6 +65,10 @@ class FileReader(object):
         # initialize object data
         self.activity_file = file_finder_list[FileFinder.ACTIVITY_FILE_INDEX]
         self.module_file = file_finder_list[FileFinder.MODULE_FILE_INDEX]
+        self.activity_element_list = []
+        self.module_element_list = []
+        self.activity_element_dict = {}
+        self.module_element_dict = {}
         self.operation_name = "UNKNOWN"
         self.constant_list = []
         self.input_interface_list = []
@@ -68,6 +77,8 @@ class FileReader(object):
         self.connection_list = []
         self.diagram_layer = ActivityDiagramLayer()
         self.condition_layer_list = []
+        # input pin uid -> [operation name, operation uid]
+        self.operation_dict = {}
 
     # Description:
     # This method looks for name of module operation.
@@ -76,13 +87,13 @@ class FileReader(object):
         # record info
         Logger.save_in_log_file("FileReader", "Looking for module operation name in .exml file", False)
 
-        # search for operation definition in module file
-        for i in range(0, len(self.module_file)):
+        # search for operation definition in module elements
+        for element in self.module_element_list:
 
             # if operation section is found
-            if "<COMP relation=\"OwnedOperation\">" in self.module_file[i]:
+            if element.get_components("OwnedOperation"):
                 # get operation name
-                self.operation_name = FileSupporter.get_name(self.module_file[i + 2])
+                self.operation_name = element.get_components("OwnedOperation")[0].name
                 # record info
                 Logger.save_in_log_file("FileReader", "Have found " + str(self.operation_name) + " operation name",
                                         False)
@@ -94,49 +105,38 @@ class FileReader(object):
         # record info
         Logger.save_in_log_file("FileReader", "Looking for module constant elements in .exml file", False)
 
-        # search for constant definition in module file
-        for i in range(0, len(self.module_file)):
+        # search for constant definition in module elements
+        for element in FileParser.get_elements(self.module_element_dict, ["Standard.Attribute"]):
 
-            constant_name = "UNKNOWN"
-            constant_type = "UNKNOWN"
             constant_value = "UNKNOWN"
 
-            # if constant section is found
-            if "<ID name=" in self.module_file[i] and "mc=\"Standard.Attribute\"" in self.module_file[i]:
-                # get constant name
-                constant_name = FileSupporter.get_name(self.module_file[i])
-
-                # search for constant value and type
-                for j in range(i, len(self.module_file)):
-
-                    # if constant value is found
-                    if "<ATT name=\"Value\"" in self.module_file[j]:
-                        # get constant value
-                        constant_value_start_position = self.module_file[j].find("[CDATA[")
-                        constant_value_end_position = self.module_file[j].find("]]")
-                        constant_value = self.module_file[j][constant_value_start_position+7:constant_value_end_position]
-
-                    # if constant type is found
-                    if "<ID name=" in self.module_file[j] and "mc=\"Standard.DataType\"" in self.module_file[j]:
-                        # get constant type
-                        constant_type = FileSupporter.get_name(self.module_file[j])
-
-                        # constant element
-                        constant_element = []
-
-                        # append constant type, name and value to constant element
-                        constant_element.insert(FileReader.DATA_ELEMENT_TYPE_INDEX, constant_type)
-                        constant_element.insert(FileReader.DATA_ELEMENT_NAME_INDEX, constant_name)
-                        constant_element.insert(FileReader.DATA_ELEMENT_VALUE_INDEX, constant_value)
-                        # append constant element to constant list
-                        self.constant_list.append(constant_element)
-                        # record info
-                        Logger.save_in_log_file("FileReader",
-                                                "Have found constant " + str(constant_element) + " element",
-                                                False)
-
-                        # exit 'for j in range' loop
-                        break
+            # if constant type is defined
+            if element.get_references_of_class("Standard.DataType"):
+                # get constant name and type
+                constant_name = element.name
+                constant_type = element.get_references_of_class("Standard.DataType")[0].name
+
+                # if constant value is found
+                if "Value" in element.attribute_dict:
+                    # get constant value
+                    constant_value_line = element.attribute_dict["Value"]
+                    constant_value_start_position = constant_value_line.find("[CDATA[")
+                    constant_value_end_position = constant_value_line.find("]]")
+                    constant_value = constant_value_line[constant_value_start_position+7:constant_value_end_position]
+
+                # constant element
+                constant_element = []
+
+                # append constant type, name and value to constant element
+                constant_element.insert(FileReader.DATA_ELEMENT_TYPE_INDEX, constant_type)
+                constant_element.insert(FileReader.DATA_ELEMENT_NAME_INDEX, constant_name)
+                constant_element.insert(FileReader.DATA_ELEMENT_VALUE_INDEX, constant_value)
+                # append constant element to constant list
+                self.constant_list.append(constant_element)
+                # record info
+                Logger.save_in_log_file("FileReader",
+                                        "Have found constant " + str(constant_element) + " element",
+                                        False)
 
     # Description:
     # This method looks for interface elements of module operation.
@@ -145,91 +145,57 @@ class FileReader(object):
         # record info
         Logger.save_in_log_file("FileReader", "Looking for module interface elements in .exml file", False)
 
-        # search for external interface details of operation in module file
+        # search for external interface details of operation in module elements
         # i.e. operation input and output parameters
-        for i in range(0, len(self.module_file)):
-
-            # parameter details
-            parameter_name = "UNKNOWN"
-            parameter_direction = "UNKNOWN"
-            parameter_type = "UNKNOWN"
-
-            # if parameter section if found
-            if "<ID name=" in self.module_file[i] and "mc=\"Standard.Parameter\"" in self.module_file[i]:
-                # get parameter name
-                parameter_name = FileSupporter.get_name(self.module_file[i])
-
-                # search for parameter input/output direction and type
-                for j in range(i, len(self.module_file)):
-
-                    # if parameter direction is found
-                    if "<ATT name=\"ParameterPassing\">In</ATT>" in self.module_file[j]:
-                        # set input direction
-                        parameter_direction = "INPUT"
-                    elif "<ATT name=\"ParameterPassing\">Out</ATT>" in self.module_file[j]:
-                        # set output direction
-                        parameter_direction = "OUTPUT"
-
-                    # if parameter type is found
-                    if "<ID name=" in self.module_file[j] and "mc=\"Standard.DataType\"" in self.module_file[j]:
-                        # get parameter type
-                        parameter_type = FileSupporter.get_name(self.module_file[j])
-
-                        # interface element
-                        interface_element = []
-
-                        # append parameter type and name to interface element
-                        interface_element.insert(FileReader.DATA_ELEMENT_TYPE_INDEX, parameter_type)
-                        interface_element.insert(FileReader.DATA_ELEMENT_NAME_INDEX, parameter_name)
-
-                        # if it is input parameter
-                        if parameter_direction == "INPUT":
-                            # append interface element to input interface list
-                            self.input_interface_list.append(interface_element)
-                        # else if it is output parameter
-                        elif parameter_direction == "OUTPUT":
-                            # append interface element to output interface list
-                            self.output_interface_list.append(interface_element)
-
-                        # exit 'for j in range' loop
-                        break
-
-        # search for internal interface details of operation in activity file
+        for element in FileParser.get_elements(self.module_element_dict, ["Standard.Parameter"]):
+
+            # if parameter type is defined
+            if element.get_references_of_class("Standard.DataType"):
+                # get parameter name and type
+                parameter_name = element.name
+                parameter_type = element.get_references_of_class("Standard.DataType")[0].name
+
+                # interface element
+                interface_element = []
+
+                # append parameter type and name to interface element
+                interface_element.insert(FileReader.DATA_ELEMENT_TYPE_INDEX, parameter_type)
+                interface_element.insert(FileReader.DATA_ELEMENT_NAME_INDEX, parameter_name)
+
+                # if it is input parameter
+                if element.attribute_dict.get("ParameterPassing") == "<ATT name=\"ParameterPassing\">In</ATT>":
+                    # append interface element to input interface list
+                    self.input_interface_list.append(interface_element)
+                # else if it is output parameter
+                elif element.attribute_dict.get("ParameterPassing") == "<ATT name=\"ParameterPassing\">Out</ATT>":
+                    # append interface element to output interface list
+                    self.output_interface_list.append(interface_element)
+
+        # local interface elements already found, (local type, local name) -> interface element,
+        # the same local can appear many times on activity diagram
+        local_interface_dict = {}
+
+        # search for internal interface details of operation in activity elements
         # i.e. operation local variables
-        for i in range(0, len(self.activity_file)):
-
-            # local details
-            local_name = "UNKNOWN"
-            local_type = "UNKNOWN"
-
-            # if local section is found and it is not an attribute
-            if "<OBJECT>" in self.activity_file[i] and \
-                    "<ID name=" in self.activity_file[i+1] and \
-                    "mc=\"Standard.InstanceNode\"" in self.activity_file[i+1] and \
-                    "mc=\"Standard.Attribute\"" not in self.activity_file[i + 13]:
-                # get local name
-                local_name = FileSupporter.get_name(self.activity_file[i+1])
-
-                # search for local direction and type
-                for j in range(i, len(self.activity_file)):
-
-                    # if local type is found
-                    if "<ID name=" in self.activity_file[j] and "mc=\"Standard.DataType\"" in self.activity_file[j]:
-                        # get local type
-                        local_type = FileSupporter.get_name(self.activity_file[j])
-
-                        # interface element
-                        interface_element = []
-
-                        # append local type and name to interface element
-                        interface_element.insert(FileReader.DATA_ELEMENT_TYPE_INDEX, local_type)
-                        interface_element.insert(FileReader.DATA_ELEMENT_NAME_INDEX, local_name)
-                        # append interface element to interface list
-                        if interface_element not in self.local_interface_list:
-                            self.local_interface_list.append(interface_element)
-
-                        # exit 'for j in range' loop
-                        break
+        for element in FileParser.get_elements(self.activity_element_dict, ["Standard.InstanceNode"]):
+
+            # if local is not an attribute and its type is defined
+            if not FileReader.is_represented_by_attribute(element) and \
+                    element.get_references_of_class("Standard.DataType"):
+                # get local name and type
+                local_name = element.name
+                local_type = element.get_references_of_class("Standard.DataType")[0].name
+
+                # interface element
+                interface_element = []
+
+                # append local type and name to interface element
+                interface_element.insert(FileReader.DATA_ELEMENT_TYPE_INDEX, local_type)
+                interface_element.insert(FileReader.DATA_ELEMENT_NAME_INDEX, local_name)
+                # append interface element to interface list, unless it is already there
+                if (local_type, local_name) not in local_interface_dict:
+                    local_interface_dict[(local_type, local_name)] = interface_element
+                    self.local_interface_list.append(interface_element)
 
         # record info
         for input_interface in self.input_interface_list:
@@ -242,6 +208,30 @@ class FileReader(object):
             Logger.save_in_log_file("FileReader", "Have found local interface " + str(local_interface) + " element",
                                     False)
 
+    # Description:
+    # This method checks if local data element is represented by an attribute, i.e. module constant.
+    @staticmethod
+    def is_represented_by_attribute(element):
+
+        # return true if element refers to an attribute
+        return len(element.get_references_of_class("Standard.Attribute")) > 0
+
+    # Description:
+    # This method returns targets of flows going out from given element, i.e. elements referred by the flows.
+    @staticmethod
+    def get_flow_targets(element):
+
+        # list of target elements
+        target_list = []
+
+        # for each outgoing flow
+        for flow in element.get_components("Outgoing"):
+            # append flow targets to target list
+            target_list.extend(flow.get_references("Target"))
+
+        # return list of target elements
+        return target_list
+
     # Description:
     # This method looks for data targets on activity diagram.
     def read_data_targets(self):
@@ -249,128 +239,76 @@ class FileReader(object):
         # record info
         Logger.save_in_log_file("FileReader", "Looking for module data targets in .exml file", False)
 
-        # search for data elements in activity file
-        for i in range(0, len(self.activity_file)):
-
-            # if data section if found
-            if "<OBJECT>" in self.activity_file[i] and \
-                    "<ID name=" in self.activity_file[i + 1] and \
-                    (("mc=\"Standard.ActivityParameterNode\"" in self.activity_file[i+1]) or
-                     ("mc=\"Standard.InstanceNode\"" in self.activity_file[i+1])):
-
-                # get connection index
-                connection_index = i + 1
-
-                # if it is local data represented by an attribute
-                if "mc=\"Standard.Attribute\"" in self.activity_file[i + 13]:
-                    # get source data name from attribute
-                    source_data_name = FileSupporter.get_name(self.activity_file[i + 13])
-                else:
-                    # get source data name from instance node or activity parameter node
-                    source_data_name = FileSupporter.get_name(self.activity_file[i + 1])
-
-                # set data type depending on data section type
-                if "mc=\"Standard.ActivityParameterNode\"" in self.activity_file[i+1]:
-                    # set parameter data type
-                    source_data_type = ActivityConnection.PARAMETER
-                else:
-                    # set local data type
-                    source_data_type = ActivityConnection.LOCAL
-
-                # assume that data element does not have target section
-                target_section_found = False
-
-                # search for targets
-                for j in range(i, len(self.activity_file)):
-
-                    # if target section is found
-                    if "<COMP relation=\"Outgoing\">" in self.activity_file[j]:
-                        # set flag
-                        target_section_found = True
-
-                    # if target reference if found
-                    if "<LINK relation=\"Target\">" in self.activity_file[j]:
-
-                        # new connection instance
-                        connection = ActivityConnection()
-
-                        # set connection index and source details
-                        connection.index = connection_index
-                        connection.source_name = source_data_name
-                        connection.source_type = source_data_type
-
-                        # if local data is target
-                        if "<ID name=" in self.activity_file[j + 2] and \
-                                "mc=\"Standard.InstanceNode\"" in self.activity_file[j + 2]:
-                            # get target data name
-                            target_data_name = FileSupporter.get_name(self.activity_file[j + 2])
-                            # set connection target details
-                            connection.target_name = target_data_name
-                            connection.target_type = ActivityConnection.LOCAL
-                            # append connection to connection list
-                            self.connection_list.append(connection)
-                            # record info
-                            Logger.save_in_log_file("FileReader", "Have found " + str(connection) + " connection",
-                                                    False)
-
-                        # if local parameter is target
-                        if "<ID name=" in self.activity_file[j + 2] and \
-                                "mc=\"Standard.ActivityParameterNode\"" in self.activity_file[j + 2]:
-                            # get target data name
-                            target_data_name = FileSupporter.get_name(self.activity_file[j + 2])
-                            # set connection target details
-                            connection.target_name = target_data_name
-                            connection.target_type = ActivityConnection.PARAMETER
-                            # append connection to connection list
-                            self.connection_list.append(connection)
-                            # record info
-                            Logger.save_in_log_file("FileReader", "Have found " + str(connection) + " connection",
-                                                    False)
-
-                        # if local action is target
-                        if "<ID name=" in self.activity_file[j + 2] and \
-                                "mc=\"Standard.OpaqueAction\"" in self.activity_file[j + 2]:
-                            # get target action name and uid
-                            target_action_name = FileSupporter.get_name(self.activity_file[j + 2])
-                            target_action_uid = FileSupporter.get_uid(self.activity_file[j + 2])
-                            # set connection target details
-                            connection.target_name = target_action_name
-                            connection.target_uid = target_action_uid
-                            connection.target_type = ActivityConnection.ACTION
-                            # append connection to connection list
-                            self.connection_list.append(connection)
-                            # record info
-                            Logger.save_in_log_file("FileReader", "Have found " + str(connection) + " connection",
-                                                    False)
-
-                        # if other operation is target
-                        if "<ID name=" in self.activity_file[j + 2] and \
-                                "mc=\"Standard.InputPin\"" in self.activity_file[j + 2]:
-                            # get target pin name and pin uid
-                            target_pin_name = FileSupporter.get_name(self.activity_file[j + 2])
-                            target_pin_uid = FileSupporter.get_uid(self.activity_file[j + 2])
-                            # find target operation name and operation uid
-                            target_operation_name, target_operation_uid = self.find_operation(target_pin_uid)
-                            # set connection target details
-                            connection.target_pin = target_pin_name
-                            connection.target_name = target_operation_name
-                            connection.target_uid = target_operation_uid
-                            connection.target_type = ActivityConnection.OPERATION
-                            # append connection to connection list
-                            self.connection_list.append(connection)
-                            # record info
-                            Logger.save_in_log_file("FileReader", "Have found " + str(connection) + " connection",
-                                                    False)
-
-                    # if end of target section is found
-                    if "</COMP>" in self.activity_file[j]:
-                        # exit 'for j in range' loop
-                        break
-
-                    # if there is no target section and end of dependencies section is found
-                    if "</DEPENDENCIES>" in self.activity_file[j] and not target_section_found:
-                        # exit 'for j in range' loop
-                        break
+        # search for data elements in activity elements
+        for element in FileParser.get_elements(self.activity_element_dict,
+                                               ["Standard.ActivityParameterNode", "Standard.InstanceNode"]):
+
+            # get connection index
+            connection_index = element.index
+
+            # if it is local data represented by an attribute
+            if FileReader.is_represented_by_attribute(element):
+                # get source data name from attribute
+                source_data_name = element.get_references_of_class("Standard.Attribute")[0].name
+            else:
+                # get source data name from instance node or activity parameter node
+                source_data_name = element.name
+
+            # set data type depending on data section type
+            if element.element_class == "Standard.ActivityParameterNode":
+                # set parameter data type
+                source_data_type = ActivityConnection.PARAMETER
+            else:
+                # set local data type
+                source_data_type = ActivityConnection.LOCAL
+
+            # search for targets
+            for target in FileReader.get_flow_targets(element):
+
+                # new connection instance
+                connection = ActivityConnection()
+
+                # set connection index and source details
+                connection.index = connection_index
+                connection.source_name = source_data_name
+                connection.source_type = source_data_type
+
+                # if local data is target
+                if target.element_class == "Standard.InstanceNode":
+                    # set connection target details
+                    connection.target_name = target.name
+                    connection.target_type = ActivityConnection.LOCAL
+
+                # if local parameter is target
+                elif target.element_class == "Standard.ActivityParameterNode":
+                    # set connection target details
+                    connection.target_name = target.name
+                    connection.target_type = ActivityConnection.PARAMETER
+
+                # if local action is target
+                elif target.element_class == "Standard.OpaqueAction":
+                    # set connection target details
+                    connection.target_name = target.name
+                    connection.target_uid = target.uid
+                    connection.target_type = ActivityConnection.ACTION
+
+                # if other operation is target
+                elif target.element_class == "Standard.InputPin":
+                    # find target operation name and operation uid
+                    target_operation_name, target_operation_uid = self.find_operation(target.uid)
+                    # set connection target details
+                    connection.target_pin = target.name
+                    connection.target_name = target_operation_name
+                    connection.target_uid = target_operation_uid
+                    connection.target_type = ActivityConnection.OPERATION
+
+                # if target is known
+                if connection.target_type != ActivityConnection.UNKNOWN:
+                    # append connection to connection list
+                    self.connection_list.append(connection)
+                    # record info
+                    Logger.save_in_log_file("FileReader", "Have found " + str(connection) + " connection",
+                                            False)
 
     # Description:
     # This method looks for interaction targets on activity diagram.
@@ -379,112 +317,71 @@ class FileReader(object):
         # record info
         Logger.save_in_log_file("FileReader", "Looking for module interaction targets in .exml file", False)
 
-        # search for interaction elements in activity file
-        for i in range(0, len(self.activity_file)):
-
-            # if interaction section if found
-            if "<OBJECT>" in self.activity_file[i] and \
-                    "<ID name=" in self.activity_file[i + 1] and \
-                    (("mc=\"Standard.OpaqueAction\"" in self.activity_file[i + 1]) or
-                     ("mc=\"Standard.CallOperationAction\"" in self.activity_file[i + 1])):
-
-                # get connection index, name and uid
-                connection_index = i + 1
-                source_interaction_name = FileSupporter.get_name(self.activity_file[i+1])
-                source_interaction_uid = FileSupporter.get_uid(self.activity_file[i+1])
-
-                # if interaction is action type
-                if "mc=\"Standard.OpaqueAction\"" in self.activity_file[i + 1]:
-                    # set action type
-                    source_interaction_type = ActivityConnection.ACTION
-                # if interaction is operation type
-                else:
-                    # set operation type
-                    source_interaction_type = ActivityConnection.OPERATION
-
-                # unknown output pin from operation
-                source_pin_name = "UNKNOWN"
-
-                # assume that interaction element does not have target section
-                target_section_found = False
-
-                # search for targets
-                for j in range(i, len(self.activity_file)):
-
-                    # if target section is found
-                    if "<COMP relation=\"Outgoing\">" in self.activity_file[j]:
-                        # set flag
-                        target_section_found = True
-
-                    # if source pin is found
-                    if "<ID name=" in self.activity_file[j] and "mc=\"Standard.OutputPin\"" in self.activity_file[j]:
-                        # get source pin name
-                        source_pin_name = FileSupporter.get_name(self.activity_file[j])
-
-                    # if target reference if found
-                    if "<LINK relation=\"Target\">" in self.activity_file[j]:
-
-                        # new connection instance
-                        connection = ActivityConnection()
-
-                        # set connection index and source details
-                        connection.index = connection_index
-                        connection.source_name = source_interaction_name
-                        connection.source_uid = source_interaction_uid
-                        connection.source_type = source_interaction_type
-
-                        # if operation
-                        if connection.source_type == ActivityConnection.OPERATION:
-                            # set connection source pin
-                            connection.source_pin = source_pin_name
-
-                        # if local data is target
-                        if "<ID name=" in self.activity_file[j + 2] and \
-                                "mc=\"Standard.InstanceNode\"" in self.activity_file[j + 2]:
-                            # get target data name
-                            target_data_name = FileSupporter.get_name(self.activity_file[j + 2])
-                            # set connection target details
-                            connection.target_name = target_data_name
-                            connection.target_type = ActivityConnection.LOCAL
-                            # append connection to connection list
-                            self.connection_list.append(connection)
-                            # record info
-                            Logger.save_in_log_file("FileReader", "Have found " + str(connection) + " connection",
-                                                    False)
-
-                        # if local parameter is target
-                        if "<ID name=" in self.activity_file[j + 2] and \
-                                "mc=\"Standard.ActivityParameterNode\"" in self.activity_file[j + 2]:
-                            # get target data name
-                            target_data_name = FileSupporter.get_name(self.activity_file[j + 2])
-                            # set connection target details
-                            connection.target_name = target_data_name
-                            connection.target_type = ActivityConnection.PARAMETER
-                            # append connection to connection list
-                            self.connection_list.append(connection)
-                            # record info
-                            Logger.save_in_log_file("FileReader", "Have found " + str(connection) + " connection",
-                                                    False)
-
-                    # if end of action target section is found
-                    if "</COMP>" in self.activity_file[j] and \
-                            source_interaction_type == ActivityConnection.ACTION:
-                        # exit "for j in range" loop
-                        break
-
-                    # if end of operation target section is found
-                    if "</COMP>" in self.activity_file[j] and \
-                            "</DEPENDENCIES>" in self.activity_file[j+1] and \
-                            "</OBJECT>" in self.activity_file[j+2] and \
-                            "</COMP>" in self.activity_file[j+3] and \
-                            source_interaction_type == ActivityConnection.OPERATION:
-                        # exit "for j in range" loop
-                        break
-
-                    # if there is no target section and end of dependencies section is found
-                    if "</DEPENDENCIES>" in self.activity_file[j] and not target_section_found:
-                        # exit 'for j in range' loop
-                        break
+        # search for interaction elements in activity elements
+        for element in FileParser.get_elements(self.activity_element_dict,
+                                               ["Standard.OpaqueAction", "Standard.CallOperationAction"]):
+
+            # get connection index, name and uid
+            connection_index = element.index
+            source_interaction_name = element.name
+            source_interaction_uid = element.uid
+
+            # list of sources of flows going out from interaction, i.e. [source pin name, target element]
+            interaction_target_list = []
+
+            # if interaction is action type
+            if element.element_class == "Standard.OpaqueAction":
+                # set action type
+                source_interaction_type = ActivityConnection.ACTION
+                # get action targets
+                for target in FileReader.get_flow_targets(element):
+                    interaction_target_list.append(["UNKNOWN", target])
+
+            # if interaction is operation type
+            else:
+                # set operation type
+                source_interaction_type = ActivityConnection.OPERATION
+                # get operation targets from each output pin
+                for output_pin in element.get_components_of_class("Standard.OutputPin"):
+                    for target in FileReader.get_flow_targets(output_pin):
+                        interaction_target_list.append([output_pin.name, target])
+
+            # search for targets
+            for source_pin_name, target in interaction_target_list:
+
+                # new connection instance
+                connection = ActivityConnection()
+
+                # set connection index and source details
+                connection.index = connection_index
+                connection.source_name = source_interaction_name
+                connection.source_uid = source_interaction_uid
+                connection.source_type = source_interaction_type
+
+                # if operation
+                if connection.source_type == ActivityConnection.OPERATION:
+                    # set connection source pin
+                    connection.source_pin = source_pin_name
+
+                # if local data is target
+                if target.element_class == "Standard.InstanceNode":
+                    # set connection target details
+                    connection.target_name = target.name
+                    connection.target_type = ActivityConnection.LOCAL
+
+                # if local parameter is target
+                elif target.element_class == "Standard.ActivityParameterNode":
+                    # set connection target details
+                    connection.target_name = target.name
+                    connection.target_type = ActivityConnection.PARAMETER
+
+                # if target is known
+                if connection.target_type != ActivityConnection.UNKNOWN:
+                    # append connection to connection list
+                    self.connection_list.append(connection)
+                    # record info
+                    Logger.save_in_log_file("FileReader", "Have found " + str(connection) + " connection",
+                                            False)
 
     # Description:
     # This method looks for condition and clause layers of module operation.
@@ -493,94 +390,42 @@ class FileReader(object):
         # record info
         Logger.save_in_log_file("FileReader", "Looking for module condition and clause layers in .exml file", False)
 
-        # counts how many "<OBJECT>" and "/<OBJECT>" occurs within condition or clause sections
-        # when given counter is decremented back to 0 then it means end of given section
-        condition_object_counter = 0
-        clause_object_counter = 0
-
-        # allows to determine whether beginning of condition or clause section have been found
-        condition_found = False
-        clause_found = False
-
-        # new condition and clause layer instances
-        condition_layer = ActivityConditionLayer()
-        clause_layer = ActivityClauseLayer()
-
-        # search for conditional elements in activity file
-        for i in range(0, len(self.activity_file)):
-
-            # if condition section is found
-            if "<OBJECT>" in self.activity_file[i-1] and \
-                    "<ID name=" in self.activity_file[i] and \
-                    "mc=\"Standard.ConditionalNode\"" in self.activity_file[i]:
-                # get condition name and uid
-                condition_name = FileSupporter.get_name(self.activity_file[i])
-                condition_uid = FileSupporter.get_uid(self.activity_file[i])
-
-                # new condition layer instance
-                condition_layer = ActivityConditionLayer()
-
-                # set condition name and uid
-                condition_layer.name = condition_name
-                condition_layer.uid = condition_uid
-
-                # new condition section is found, therefore enable counting of
-                # "<OBJECT>" and "/<OBJECT>" for condition element
-                condition_object_counter = 1
-                condition_found = True
-
-            # if clause section is found
-            if "<OBJECT>" in self.activity_file[i - 1] and \
-                    "<ID name=" in self.activity_file[i] and \
-                    "mc=\"Standard.Clause\"" in self.activity_file[i]:
-                # get clause decision and uid
-                clause_decision_start_position = self.activity_file[i+2].find("[CDATA[")
-                clause_decision_end_position = self.activity_file[i+2].find("]]>")
-                clause_decision = self.activity_file[i+2][clause_decision_start_position + 7:clause_decision_end_position]
-                clause_uid = FileSupporter.get_uid(self.activity_file[i])
+        # search for conditional elements in activity elements
+        for element in FileParser.get_elements(self.activity_element_dict, ["Standard.ConditionalNode"]):
 
-                # new clause layer instance
-                clause_layer = ActivityClauseLayer()
+            # new condition layer instance
+            condition_layer = ActivityConditionLayer()
 
-                # set clause start index, decision and uid
-                clause_layer.start_index = i
-                clause_layer.decision = clause_decision
-                clause_layer.uid = clause_uid
+            # set condition name and uid
+            condition_layer.name = element.name
+            condition_layer.uid = element.uid
 
-                # new clause section is found, therefore enable counting of
-                # "<OBJECT>" and "/<OBJECT>" for clause element
-                clause_object_counter = 1
-                clause_found = True
+            # for each clause section of condition
+            for clause in element.get_components_of_class("Standard.Clause"):
 
-            # if new "<OBJECT>" then increment required counters
-            if ("<OBJECT>" in self.activity_file[i]) and condition_found:
-                condition_object_counter = condition_object_counter+1
+                # get clause decision
+                clause_decision = "UNKNOWN"
+                if "Test" in clause.attribute_dict:
+                    clause_decision_line = clause.attribute_dict["Test"]
+                    clause_decision_start_position = clause_decision_line.find("[CDATA[")
+                    clause_decision_end_position = clause_decision_line.find("]]>")
+                    clause_decision = clause_decision_line[clause_decision_start_position + 7:
+                                                           clause_decision_end_position]
 
-                if clause_found:
-                    clause_object_counter = clause_object_counter+1
-
-            # if new "</OBJECT>" then decrement required counters
-            if ("</OBJECT>" in self.activity_file[i]) and condition_found:
-                condition_object_counter = condition_object_counter-1
+                # new clause layer instance
+                clause_layer = ActivityClauseLayer()
 
-                if clause_found:
-                    clause_object_counter = clause_object_counter-1
+                # set clause start index, end index, decision and uid
+                clause_layer.start_index = clause.index
+                clause_layer.end_index = clause.end_index
+                clause_layer.decision = clause_decision
+                clause_layer.uid = clause.uid
 
-            # if end of clause section is found
-            if (clause_object_counter == 0) and clause_found:
-                # disable counting of "<OBJECT>" and "/<OBJECT>" for clause element
-                clause_found = False
-                # set clause end index
-                clause_layer.end_index = i
                 # append clause to clause layer list
                 condition_layer.clause_layer_list.append(clause_layer)
 
-            # if end of condition section is found
-            if (condition_object_counter == 0) and condition_found:
-                # disable counting of "<OBJECT>" and "/<OBJECT>" for condition element
-                condition_found = False
-                # append condition to condition layer list
-                self.condition_layer_list.append(condition_layer)
+            # append condition to condition layer list
+            self.condition_layer_list.append(condition_layer)
 
         # record info
         for condition_layer in self.condition_layer_list:
@@ -595,6 +440,13 @@ class FileReader(object):
         # record info
         Logger.save_in_log_file("FileReader", "Allocating connections to clause layer", False)
 
+        # positions of connections in connection list, sorted by connection index, and their indexes
+        position_list = sorted(range(0, len(self.connection_list)),
+                               key=lambda position: self.connection_list[position].index)
+        index_list = [self.connection_list[position].index for position in position_list]
+        # flags to distinguish which connections have already been allocated
+        allocated_list = [False] * len(self.connection_list)
+
         # for each condition layer
         for condition_layer in self.condition_layer_list:
             Logger.save_in_log_file("FileReader", "Allocating under " + str(condition_layer) +
@@ -604,23 +456,27 @@ class FileReader(object):
                 Logger.save_in_log_file("FileReader", "Allocating under " + str(clause_layer) +
                                         " layer of .exml file", False)
 
-                # get clause start and end index
-                clause_start_index = clause_layer.start_index
-                clause_end_index = clause_layer.end_index
+                # get range of sorted connections that appear between clause start and end index,
+                # such connections belong to given clause
+                first_index = bisect_left(index_list, clause_layer.start_index)
+                last_index = bisect_right(index_list, clause_layer.end_index)
+
+                # get positions of connections from the range, which have not been allocated to previous clause,
+                # in order of connection list
+                clause_position_list = sorted([position for position in position_list[first_index:last_index]
+                                               if not allocated_list[position]])
 
-                # search for connections that appear between start and end index
-                for connection in list(self.connection_list):
+                # allocate connections to clause layer
+                for position in clause_position_list:
+                    connection = self.connection_list[position]
+                    clause_layer.connection_list.append(connection)
+                    allocated_list[position] = True
+                    Logger.save_in_log_file("FileReader", "Have allocated " + str(connection) +
+                                            " connection", False)
 
-                    # get connection index
-                    connection_index = connection.index
-                    # if connection appears between both indexes it means
-                    # that the connection belong to given clause
-                    if (connection_index >= clause_start_index) and (connection_index <= clause_end_index):
-                        # allocate connection to diagram layer
-                        clause_layer.connection_list.append(connection)
-                        self.connection_list.remove(connection)
-                        Logger.save_in_log_file("FileReader", "Have allocated " + str(connection) +
-                                                " connection", False)
+        # keep connections that were not allocated to any clause layer
+        self.connection_list = [self.connection_list[position] for position in range(0, len(self.connection_list))
+                                if not allocated_list[position]]
 
     # Description:
     # This method allocates connections to diagram layer.
@@ -629,43 +485,42 @@ class FileReader(object):
         # record info
         Logger.save_in_log_file("FileReader", "Allocating connections to diagram layer", False)
 
-        # for each remaining connection that was not allocated to any other layer
-        for connection in list(self.connection_list):
-            # allocate connection to diagram layer
-            self.diagram_layer.connection_list.append(connection)
-            self.connection_list.remove(connection)
+        # allocate all remaining connections that were not allocated to any other layer to diagram layer
+        self.diagram_layer.connection_list.extend(self.connection_list)
+        for connection in self.connection_list:
             Logger.save_in_log_file("FileReader", "Have allocated " + str(connection) +
                                     " connection", False)
+        self.connection_list = []
 
     # Description:
-    # This method looks for operation on activity diagram, basing on uid of operation input pins.
-    def find_operation(self, input_pin_uid):
-
-        # operation details
-        operation_name = "UNKNOWN"
-        operation_uid = "UNKNOWN"
-
-        # search for operation in activity file
-        for i in range(0, len(self.activity_file)):
-
-            # if operation section if found
-            if "<OBJECT>" in self.activity_file[i] and \
-                    "<ID name=" in self.activity_file[i + 1] and \
-                    "mc=\"Standard.CallOperationAction\"" in self.activity_file[i + 1]:
-                # get operation name and uid
-                operation_name = FileSupporter.get_name(self.activity_file[i + 1])
-                operation_uid = FileSupporter.get_uid(self.activity_file[i + 1])
+    # This method maps input pins of operations on activity diagram to their operations, so operation targeted
+    # by data can be found without searching activity file again.
+    def read_operation_input_pins(self):
+
+        # search for input pins in activity elements
+        for element in FileParser.get_elements(self.activity_element_dict, ["Standard.InputPin"]):
+
+            # if input pin section is found under operation section
+            if element.parent is not None and \
+                    element.parent.element_class == "Standard.CallOperationAction":
+                # map input pin uid to operation name and uid
+                operation = []
+                operation.insert(FileReader.OPERATION_NAME_LIST_INDEX, element.parent.name)
+                operation.insert(FileReader.OPERATION_UID_LIST_INDEX, element.parent.uid)
+                self.operation_dict[element.uid] = operation
 
-            # if input uid if found under above operation
-            if "<OBJECT>" in self.activity_file[i] and \
-                    "<ID name=" in self.activity_file[i + 1] and \
-                    "mc=\"Standard.InputPin\"" in self.activity_file[i + 1] and \
-                    input_pin_uid in self.activity_file[i + 1]:
-                # exit 'for i in range' loop
-                break
+    # Description:
+    # This method looks for operation, which owns given input pin, and returns its name and uid.
+    def find_operation(self, input_pin_uid):
 
-        # return operation
-        return operation_name, operation_uid
+        # if input pin of operation is known
+        if input_pin_uid in self.operation_dict:
+            # return operation name and uid
+            return self.operation_dict[input_pin_uid][FileReader.OPERATION_NAME_LIST_INDEX], \
+                self.operation_dict[input_pin_uid][FileReader.OPERATION_UID_LIST_INDEX]
+        else:
+            # return unknown operation
+            return "UNKNOWN", "UNKNOWN"
 
     # Description:
     # This method is responsible for reading of module content.
@@ -674,12 +529,20 @@ class FileReader(object):
         # record info
         Logger.save_in_log_file("FileReader", "Reading module details from set of .exml files", True)
 
+        # build trees of module and activity elements, so each file is searched only once
+        self.module_element_list = FileParser.parse_file(self.module_file)
+        self.activity_element_list = FileParser.parse_file(self.activity_file)
+        # group elements by their class, so each stage visits only relevant elements
+        self.module_element_dict = FileParser.group_elements(self.module_element_list)
+        self.activity_element_dict = FileParser.group_elements(self.activity_element_list)
+
         # search for module details
         self.read_operation_name()
         self.read_constant_elements()
         self.read_interface_elements()
 
         # search for connection details between module elements
+        self.read_operation_input_pins()
         self.read_data_targets()
         self.read_interaction_targets()
 
@@ -690,6 +553,15 @@ class FileReader(object):
         self.allocate_connections_to_clause_layer()
         self.allocate_connections_to_diagram_layer()
 
+        # release file content and element trees, which are not needed once module content is read
+        self.activity_file = []
+        self.module_file = []
+        self.activity_element_list = []
+        self.module_element_list = []
+        self.activity_element_dict = {}
+        self.module_element_dict = {}
+        self.operation_dict = {}
+
         # append collected data to file reader list
         file_reader_list = []
         file_reader_list.insert(FileReader.OPERATION_NAME_INDEX, self.operation_name)
@@ -28,6 +28,10 @@
 #       along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
+import re
+from sys import intern
+
+
 # Description:
 # This class provides additional methods and parameters reused by other classes.
 class FileSupporter(object):
@@ -52,6 +56,59 @@ class FileSupporter(object):
     # <ID name="ADD" mc="Standard.OpaqueAction" uid="4f855500-ccdd-43a6-87d3-cc06dd16a59b"/>
     UID_END_OFFSET = -3
 
+    # This parameter defines start offset of mc element after "mc" marker in line of .exml file, i.e.
+    # number of characters after occurrence of "mc" marker, where beginning of mc element occurs, an example:
+    # <ID name="ADD" mc="Standard.OpaqueAction" uid="4f855500-ccdd-43a6-87d3-cc06dd16a59b"/>
+    CLASS_START_OFFSET = 4
+
+    # pattern of name, mc and uid elements in line of .exml file, an example:
+    # <ID name="ADD" mc="Standard.OpaqueAction" uid="4f855500-ccdd-43a6-87d3-cc06dd16a59b"/>
+    ELEMENT_ID_PATTERN = re.compile(r'name="([^"]*)" mc="([^"]*)" uid="([^"]*)"')
+
+    # lines of .exml file already read by get_element_id method, line -> (name, mc, uid),
+    # the same lines repeat often, e.g. in each reference to the same element
+    element_id_dict = {}
+    # maximal number of lines kept in above dictionary
+    ELEMENT_ID_DICT_MAX_SIZE = 100000
+
+    # Description:
+    # This method looks for <name>, <mc> and <uid> elements within line of .exml file at once and returns them
+    # together, an example of .exml file line:
+    # <ID name="ADD" mc="Standard.OpaqueAction" uid="4f855500-ccdd-43a6-87d3-cc06dd16a59b"/>
+    @staticmethod
+    def get_element_id(line):
+
+        # if line has already been read
+        if line in FileSupporter.element_id_dict:
+            # return name, mc and uid
+            return FileSupporter.element_id_dict[line]
+
+        # find name, mc and uid within the line
+        element_id_match = FileSupporter.ELEMENT_ID_PATTERN.search(line)
+
+        # if all elements are found
+        if element_id_match:
+            # get name, mc and uid
+            name, element_class, uid = element_id_match.groups()
+        else:
+            # get name, mc and uid from their positions within the line
+            name = FileSupporter.get_name(line)
+            element_class = FileSupporter.get_class(line)
+            uid = FileSupporter.get_uid(line)
+
+        # intern name, mc and uid, so all elements and connections share one copy of each string, which also
+        # makes their comparisons cheaper
+        element_id = (intern(name), intern(element_class), intern(uid))
+
+        # if too many lines are kept, start again with empty dictionary
+        if len(FileSupporter.element_id_dict) >= FileSupporter.ELEMENT_ID_DICT_MAX_SIZE:
+            FileSupporter.element_id_dict = {}
+        # keep name, mc and uid of the line
+        FileSupporter.element_id_dict[line] = element_id
+
+        # return name, mc and uid
+        return element_id
+
     # Description:
     # This method looks for <name> element within line of .exml file, an example of .exml file line:
     # <ID name="ADD" mc="Standard.OpaqueAction" uid="4f855500-ccdd-43a6-87d3-cc06dd16a59b"/>
@@ -83,3 +140,20 @@ class FileSupporter(object):
 
         # return uid
         return uid
+
+    # Description:
+    # This method looks for <mc> element within line of .exml file, an example of .exml file line:
+    # <ID name="ADD" mc="Standard.OpaqueAction" uid="4f855500-ccdd-43a6-87d3-cc06dd16a59b"/>
+    @staticmethod
+    def get_class(line):
+
+        # find position of mc within the line
+        mc_position = line.find("mc=\"")
+        # find position of end of mc within the line
+        mc_end_position = line.find("\"", mc_position + FileSupporter.CLASS_START_OFFSET)
+
+        # get class
+        element_class = line[mc_position + FileSupporter.CLASS_START_OFFSET:mc_end_position]
+
+        # return class
+        return element_class
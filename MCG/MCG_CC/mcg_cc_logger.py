@@ -29,6 +29,7 @@
 
 
 from datetime import datetime
+from os.path import join
 
 
 # Description:
@@ -39,13 +40,18 @@ class Logger(object):
     log_file_disk = ""
     log_file_path = ""
 
+    # when enabled, log records are collected in log record list instead of being saved in log file,
+    # e.g. by worker process, which passes its log records to main process
+    log_buffer_enabled = False
+    log_record_list = []
+
     # Description:
     # This method sets path to log file, which will contain events record from MCG CC.
     @staticmethod
     def set_log_file_path(output_dir_path):
 
         # set log file path
-        Logger.log_file_path = output_dir_path + str("\\mcg_cc_log.txt")
+        Logger.log_file_path = join(output_dir_path, "mcg_cc_log.txt")
 
         # open new file in write mode, then close file, to clear previous content
         Logger.log_file_disk = open(Logger.log_file_path, "w")
@@ -72,9 +78,6 @@ class Logger(object):
     @staticmethod
     def save_in_log_file(info_source, info, add_empty_line):
 
-        # open file in append mode, ready to save fresh info in log content
-        Logger.log_file_disk = open(Logger.log_file_path, "a")
-
         # get date
         date = datetime.now()
         # format date
@@ -90,12 +93,49 @@ class Logger(object):
         # merge date, source and info
         merged_info = merged_info + date + " - " + info_source + " - " + info
 
-        # print info
-        print(merged_info)
+        # if log records are collected in log record list
+        if Logger.log_buffer_enabled:
+            # append info to log record list
+            Logger.log_record_list.append(merged_info)
+
+        else:
+            # print info
+            print(merged_info)
+
+            # open file in append mode, ready to save fresh info in log content
+            Logger.log_file_disk = open(Logger.log_file_path, "a")
+
+            # write info to log file on hard disk
+            Logger.log_file_disk.write(merged_info)
+            Logger.log_file_disk.write("\n")
+
+            # close file
+            Logger.log_file_disk.close()
+
+    # Description:
+    # This method enables collection of log records in log record list instead of log file.
+    @staticmethod
+    def enable_log_buffer():
+
+        # enable log buffer and clear previous log records
+        Logger.log_buffer_enabled = True
+        Logger.log_record_list = []
+
+    # Description:
+    # This method prints and saves in log file list of log records, collected earlier in log buffer.
+    @staticmethod
+    def save_log_records(log_record_list):
+
+        # open file in append mode, ready to save fresh info in log content
+        Logger.log_file_disk = open(Logger.log_file_path, "a")
 
-        # write info to log file on hard disk
-        Logger.log_file_disk.write(merged_info)
-        Logger.log_file_disk.write("\n")
+        # for each log record
+        for log_record in log_record_list:
+            # print info
+            print(log_record)
+            # write info to log file on hard disk
+            Logger.log_file_disk.write(log_record)
+            Logger.log_file_disk.write("\n")
 
         # close file
         Logger.log_file_disk.close()
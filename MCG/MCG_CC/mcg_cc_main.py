@@ -29,12 +29,19 @@
 #       along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
-from sys import argv
+from sys import argv, executable
+from os import makedirs
+from os.path import abspath, basename, dirname, join, normpath
+from time import sleep
+from subprocess import run
+from multiprocessing import Pool
+import tracemalloc
 from mcg_cc_file_finder import FileFinder
 from mcg_cc_file_reader import FileReader
 from mcg_cc_file_checker import FileChecker
 from mcg_cc_module_sorter import ModuleSorter
 from mcg_cc_module_converter import ModuleConverter
+from mcg_cc_module_cache import ModuleCache
 from mcg_cc_error_handler import ErrorHandler
 from mcg_cc_logger import Logger
 
@@ -53,6 +60,43 @@ class Main(object):
     MODEL_DIR_PATH_INDEX = 1
     OUTPUT_DIR_PATH_INDEX = 2
 
+    # MCG CC batch mode, where batch option is followed by output dir path and list of model dir paths,
+    # so many models are converted by one MCG CC run
+    BATCH_OPTION = "-b"
+    BATCH_OPTION_INDEX = 1
+    BATCH_OUTPUT_DIR_PATH_INDEX = 2
+
+    # MCG CC command line options, which may follow command line arguments
+    JOBS_OPTION = "-j"
+    WATCH_OPTION = "-w"
+    CGC_OPTION = "-g"
+    MODULE_OPTION = "-m"
+    TRACE_OPTION = "-t"
+
+    # number of worker processes, which convert modules in parallel
+    number_of_jobs = 1
+
+    # flag to distinguish if model directory is watched and model is converted again after each change
+    watch_enabled = False
+    # interval between checks of model directory in watch mode, in seconds
+    WATCH_INTERVAL = 1.0
+
+    # flag to distinguish if memory allocations are traced, so peak memory of each module conversion is recorded
+    trace_enabled = False
+
+    # list of names or uids of modules requested for conversion, all modules are converted when list is empty
+    module_key_list = []
+
+    # path to output directory of MCG CGC, which is run after each conversion when the path is given
+    code_dir_path = ""
+    # path to MCG CGC main module
+    MCG_CGC_MAIN_PATH = join(dirname(dirname(abspath(__file__))), "MCG_CGC", "mcg_cgc_main.py")
+
+    # indexes of module conversion results passed from worker process
+    CONFIGURATION_FILE_INDEX = 0
+    LOG_RECORD_LIST_INDEX = 1
+    ERROR_LIST_INDEX = 2
+
     # MCG CC version
     MCG_CC_VERSION = "v0.5.0-alpha"
 
@@ -73,44 +117,262 @@ class Main(object):
         print("warranty; not even for MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.")
         print()
 
-        # check if number of command line arguments is correct
-        if len(argv) - 1 == Main.NUMBER_OF_MCG_CC_CMD_LINE_ARGS:
+        # flag to distinguish if batch mode is requested
+        batch_enabled = len(argv) - 1 >= Main.BATCH_OPTION_INDEX and argv[Main.BATCH_OPTION_INDEX] == Main.BATCH_OPTION
+
+        # if batch mode is requested
+        if batch_enabled:
+            # get list of command line arguments, i.e. output dir path and model dir paths, and list of options
+            argument_list, option_list = Main.split_cmd_line(argv[Main.BATCH_OUTPUT_DIR_PATH_INDEX:])
+            # get list of model names, which name subdirectories of output directory
+            model_name_list = [basename(normpath(model_dir_path)) for model_dir_path in argument_list[1:]]
+            # arguments are correct when output dir path and at least one model dir path are given, where each model
+            # has different name, and watch mode is not requested
+            arguments_valid = len(argument_list) >= 2 and len(set(model_name_list)) == len(model_name_list) and \
+                Main.read_cmd_line_options(option_list) and not Main.watch_enabled
+        else:
+            # get list of command line arguments, i.e. model dir path and output dir path, and list of options
+            argument_list, option_list = Main.split_cmd_line(argv[Main.MODEL_DIR_PATH_INDEX:])
+            # arguments are correct when model dir path and output dir path are given
+            arguments_valid = len(argument_list) == Main.NUMBER_OF_MCG_CC_CMD_LINE_ARGS and \
+                Main.read_cmd_line_options(option_list)
+
+        # if tracing of memory allocations is requested and command line arguments are correct
+        if arguments_valid and Main.trace_enabled:
+            # start tracing of memory allocations
+            tracemalloc.start()
+
+        # if batch mode is requested and command line arguments are correct
+        if arguments_valid and batch_enabled:
+
+            # get output directory path from cmd line argument
+            output_dir_path = str(argument_list[0])
+            # get list of model directory paths from cmd line arguments
+            model_dir_path_list = [str(model_dir_path) for model_dir_path in argument_list[1:]]
+
+            # convert all models
+            Main.convert_models(output_dir_path, model_dir_path_list)
+
+        # if command line arguments are correct
+        elif arguments_valid:
 
             # get model directory path from cmd line argument
             model_dir_path = str(argv[Main.MODEL_DIR_PATH_INDEX])
             # get output directory path from cmd line argument
             output_dir_path = str(argv[Main.OUTPUT_DIR_PATH_INDEX])
 
-            # set path to model directory
-            FileFinder.set_model_dir_path(model_dir_path)
-            # set path to configuration file
-            ModuleConverter.set_configuration_file_path(output_dir_path)
-            # set path to log file
-            Logger.set_log_file_path(output_dir_path)
+            # set paths to model and output directory
+            file_finder = Main.set_dir_paths(model_dir_path, output_dir_path)
 
-            # convert model
-            Main.convert_model()
+            # if watch mode is enabled
+            if Main.watch_enabled:
+                # convert model after each change
+                Main.watch_model(file_finder, output_dir_path)
+            else:
+                # convert model
+                Main.convert_model(file_finder)
+                # generate code from configuration file
+                Main.run_cgc(Main.code_dir_path)
 
         # else display info and exit
         else:
-            print("Incorrect number of command line arguments, MCG CC process cancelled.")
-            print("Usage: python mcg_cc_main.py \"<model_dir_path>\" \"<output_dir_path>\"")
+            print("Incorrect command line arguments, MCG CC process cancelled.")
+            print("Usage: python mcg_cc_main.py \"<model_dir_path>\" \"<output_dir_path>\" [-j <number_of_jobs>] [-w] "
+                  "[-g \"<code_dir_path>\"] [-m <module>]... [-t]")
+            print("       python mcg_cc_main.py -b \"<output_dir_path>\" \"<model_dir_path>\"... [-j <number_of_jobs>] "
+                  "[-g \"<code_dir_path>\"] [-m <module>]... [-t]")
             print("Arguments:")
             print("    <model_dir_path>       Path to model directory, where all catalogs with .exml files are stored")
             print("    <output_dir_path>      Path to output directory, where results from MCG CC will be saved")
+            print("Options:")
+            print("    -b                     Convert many models, with results of each model saved in subdirectory")
+            print("                           of output directory named after model directory")
+            print("    -j <number_of_jobs>    Number of worker processes, which convert modules in parallel")
+            print("    -w                     Watch model directory and convert model again after each change")
+            print("    -g <code_dir_path>     Run MCG CGC after each conversion, with code saved in given directory")
+            print("    -m <module>            Convert only module with given name or uid and modules it calls,")
+            print("                           option may be repeated to convert more modules")
+            print("    -t                     Record peak memory of each module conversion in log file, the same")
+            print("                           as running MCG CC with python -X tracemalloc")
             print("")
             print("Keep specific order of arguments, as pointed in usage above.")
             print("See Mod Code Generator Manual for further details.")
 
     # Description:
-    # This method invokes conversion of model content in form of .exml files into configuration file.
+    # This method splits command line into list of arguments and list of options, which follow the arguments.
     @staticmethod
-    def convert_model():
+    def split_cmd_line(cmd_line_list):
 
-        # saves log file header
-        Logger.save_log_file_header()
-        # saves configuration file header
-        ModuleConverter.save_configuration_file_header()
+        # number of arguments
+        i = 0
+
+        # arguments end at first known option
+        while i < len(cmd_line_list) and \
+                cmd_line_list[i] not in [Main.JOBS_OPTION, Main.WATCH_OPTION, Main.CGC_OPTION, Main.MODULE_OPTION,
+                                         Main.TRACE_OPTION]:
+            i = i + 1
+
+        # return list of arguments and list of options
+        return cmd_line_list[:i], cmd_line_list[i:]
+
+    # Description:
+    # This method reads command line options, which follow command line arguments, and returns true
+    # if all options are valid.
+    @staticmethod
+    def read_cmd_line_options(option_list):
+
+        # assume that options are valid
+        options_valid = True
+        # option index
+        i = 0
+
+        # go through all options
+        while i < len(option_list) and options_valid:
+
+            # if number of jobs is given
+            if option_list[i] == Main.JOBS_OPTION and i + 1 < len(option_list) and \
+                    option_list[i + 1].isdigit() and int(option_list[i + 1]) > 0:
+                # get number of jobs
+                Main.number_of_jobs = int(option_list[i + 1])
+                i = i + 2
+
+            # if watch mode is requested
+            elif option_list[i] == Main.WATCH_OPTION:
+                # enable watch mode
+                Main.watch_enabled = True
+                i = i + 1
+
+            # if module is requested
+            elif option_list[i] == Main.MODULE_OPTION and i + 1 < len(option_list):
+                # append module name or uid to list of requested modules
+                Main.module_key_list.append(str(option_list[i + 1]))
+                i = i + 2
+
+            # if tracing of memory allocations is requested
+            elif option_list[i] == Main.TRACE_OPTION:
+                # enable tracing of memory allocations
+                Main.trace_enabled = True
+                i = i + 1
+
+            # if code generation is requested
+            elif option_list[i] == Main.CGC_OPTION and i + 1 < len(option_list):
+                # get code directory path
+                Main.code_dir_path = str(option_list[i + 1])
+                i = i + 2
+
+            else:
+                # unknown or incomplete option
+                options_valid = False
+
+        # return flag
+        return options_valid
+
+    # Description:
+    # This method converts content of one module, described by set of .exml files, and returns its configuration.
+    # Conversion stops when error is recorded, the error is then handled by the caller.
+    @staticmethod
+    def convert_module(file_finder_list):
+
+        # module configuration
+        configuration_file = []
+
+        # if memory allocations are traced, i.e. when MCG CC is run with -t option or python is run with
+        # -X tracemalloc option, measure peak memory of this module conversion
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+        try:
+            # read module and activity files
+            FileFinder.read_files(file_finder_list)
+
+            # initialize file reader
+            file_reader = FileReader(file_finder_list)
+            # read module content
+            file_reader_list = file_reader.read_files()
+
+        finally:
+            # release module and activity files, also when reading is stopped due to errors, module content
+            # is converted from file reader list only
+            FileFinder.close_files(file_finder_list)
+
+        # initialize file checker
+        file_checker = FileChecker(file_reader_list)
+        # check module content
+        file_checker.check_files()
+
+        # if no errors have been found
+        if not ErrorHandler.errors_found():
+            # initialize module sorter
+            module_sorter = ModuleSorter(file_reader_list)
+            # sort module content
+            module_sorter.sort_module()
+
+            # if no errors have been found
+            if not ErrorHandler.errors_found():
+                # initialize module converter
+                module_converter = ModuleConverter(file_finder_list[FileFinder.MODULE_NAME_INDEX], file_reader_list)
+                # convert module content
+                configuration_file = module_converter.convert_module()
+
+        # if memory allocations are traced
+        if tracemalloc.is_tracing():
+            # record info
+            Logger.save_in_log_file("Main", "Peak memory of module " + file_finder_list[FileFinder.MODULE_NAME_INDEX] +
+                                    " conversion: " + str(tracemalloc.get_traced_memory()[1] // 1024) + " KiB",
+                                    False)
+
+        # return module configuration
+        return configuration_file
+
+    # Description:
+    # This method saves results of module conversion, i.e. stores module configuration fragment in cache
+    # and saves it in configuration file.
+    @staticmethod
+    def save_module(file_finder_list, configuration_file):
+
+        # store module configuration in cache
+        ModuleCache.store_module(file_finder_list, configuration_file)
+        # save module configuration
+        ModuleConverter.save_in_configuration_file(configuration_file)
+
+    # Description:
+    # This method initializes worker process, which converts modules in parallel.
+    @staticmethod
+    def initialize_worker(trace_enabled):
+
+        # collect log records, which are passed to main process and saved there in module order
+        Logger.enable_log_buffer()
+
+        # if tracing of memory allocations is requested and worker process has not inherited it
+        if trace_enabled and not tracemalloc.is_tracing():
+            # start tracing of memory allocations
+            tracemalloc.start()
+
+    # Description:
+    # This method converts content of one module within worker process and returns results to main process.
+    @staticmethod
+    def convert_module_in_worker(file_finder_list):
+
+        # clear log records and errors from previous module
+        Logger.log_record_list = []
+        ErrorHandler.error_list = []
+
+        # convert module content
+        configuration_file = Main.convert_module(file_finder_list)
+
+        # append module configuration, log records and errors to module result list
+        module_result_list = []
+        module_result_list.insert(Main.CONFIGURATION_FILE_INDEX, configuration_file)
+        module_result_list.insert(Main.LOG_RECORD_LIST_INDEX, Logger.log_record_list)
+        module_result_list.insert(Main.ERROR_LIST_INDEX, ErrorHandler.error_list)
+
+        # return module result list
+        return module_result_list
+
+    # Description:
+    # This method converts modules one after another.
+    @staticmethod
+    def convert_modules_in_sequence(file_finder):
 
         # flag to distinguish if set of matching .exml files has been found for further conversion
         files_found = True
@@ -118,8 +380,8 @@ class Main(object):
         # repeat until all modules are converted into configuration file
         while files_found:
 
-            # find module files
-            file_finder_list = FileFinder.find_files()
+            # find paths to module files
+            file_finder_list = file_finder.find_file_paths()
             # get files flag
             files_found = file_finder_list[FileFinder.FILES_FOUND_INDEX]
 
@@ -128,37 +390,309 @@ class Main(object):
 
             # if files have been found
             if files_found:
-                # initialize file reader
-                file_reader = FileReader(file_finder_list)
-                # read module content
-                file_reader_list = file_reader.read_files()
+                # look for module configuration in cache
+                configuration_file = ModuleCache.find_module(file_finder, file_finder_list)
 
-                # initialize file checker
-                file_checker = FileChecker(file_reader_list)
-                # check module content
-                file_checker.check_files()
+                # if module files have changed since last conversion
+                if not configuration_file:
+                    # convert module content
+                    configuration_file = Main.convert_module(file_finder_list)
 
-                # check errors
-                ErrorHandler.check_errors()
+                    # check errors
+                    ErrorHandler.check_errors()
 
-                # initialize module sorter
-                module_sorter = ModuleSorter(file_reader_list)
-                # sort module content
-                module_sorter.sort_module()
+                # save results of module conversion
+                Main.save_module(file_finder_list, configuration_file)
 
-                # check errors
-                ErrorHandler.check_errors()
+    # Description:
+    # This method returns size of module, i.e. total size of its module and activity .exml files.
+    @staticmethod
+    def get_module_size(file_finder, file_finder_list):
 
-                # initialize module converter
-                module_converter = ModuleConverter(file_finder_list, file_reader_list)
-                # convert module content
-                module_converter.convert_module()
+        # return module size
+        return file_finder.get_file_size(file_finder_list[FileFinder.MODULE_SOURCE_PATH_INDEX]) + \
+            file_finder.get_file_size(file_finder_list[FileFinder.ACTIVITY_SOURCE_PATH_INDEX])
 
+    # Description:
+    # This method converts modules in worker processes and saves their configuration in order of modules.
+    @staticmethod
+    def convert_modules_in_parallel(file_finder):
+
+        # list of file finder lists, which point .exml files of each module
+        file_finder_list_list = []
+        # list of module configurations found in cache, or empty lists for modules that need to be converted
+        cached_configuration_file_list = []
+        # list of indexes of modules that need to be converted
+        changed_module_index_list = []
+
+        # flag to distinguish if set of matching .exml files has been found for further conversion
+        files_found = True
+
+        # repeat until paths to all module files are found
+        while files_found:
+
+            # find paths to module files
+            file_finder_list = file_finder.find_file_paths()
+            # get files flag
+            files_found = file_finder_list[FileFinder.FILES_FOUND_INDEX]
+
+            # if files have been found
+            if files_found:
+                # look for module configuration in cache
+                configuration_file = ModuleCache.find_module(file_finder, file_finder_list)
+                # append module to list of modules
+                file_finder_list_list.append(file_finder_list)
+                cached_configuration_file_list.append(configuration_file)
+
+                # if module files have changed since last conversion
+                if not configuration_file:
+                    # append module to list of modules to convert
+                    changed_module_index_list.append(len(file_finder_list_list) - 1)
+
+        # check errors
+        ErrorHandler.check_errors()
+
+        # convert largest modules first, so conversion of large module does not start last and delay end of run
+        module_size_list = [Main.get_module_size(file_finder, file_finder_list)
+                            for file_finder_list in file_finder_list_list]
+        changed_module_index_list.sort(key=lambda module_index: module_size_list[module_index], reverse=True)
+
+        # convert modules in worker processes
+        with Pool(Main.number_of_jobs, Main.initialize_worker, (Main.trace_enabled,)) as pool:
+
+            # pending results of module conversion, module index -> result of worker process
+            converted_module_result_dict = {}
+            for module_index in changed_module_index_list:
+                converted_module_result_dict[module_index] = pool.apply_async(Main.convert_module_in_worker,
+                                                                              (file_finder_list_list[module_index],))
+
+            # for each module, in order of modules
+            for module_index in range(0, len(file_finder_list_list)):
+
+                # get module details
+                file_finder_list = file_finder_list_list[module_index]
+                configuration_file = cached_configuration_file_list[module_index]
+
+                # if module has been converted in worker process
+                if not configuration_file:
+                    # wait for results of module conversion
+                    module_result_list = converted_module_result_dict[module_index].get()
+
+                    # save log records and errors from worker process
+                    Logger.save_log_records(module_result_list[Main.LOG_RECORD_LIST_INDEX])
+                    ErrorHandler.error_list.extend(module_result_list[Main.ERROR_LIST_INDEX])
+
+                    # check errors
+                    ErrorHandler.check_errors()
+
+                    # get module configuration
+                    configuration_file = module_result_list[Main.CONFIGURATION_FILE_INDEX]
+
+                # save results of module conversion
+                Main.save_module(file_finder_list, configuration_file)
+
+    # Description:
+    # This method sets paths to model and output directory, and returns file finder of the model.
+    @staticmethod
+    def set_dir_paths(model_dir_path, output_dir_path):
+
+        # set path to configuration file
+        ModuleConverter.set_configuration_file_path(output_dir_path)
+        # set path to log file
+        Logger.set_log_file_path(output_dir_path)
+        # set path to cache file
+        ModuleCache.set_cache_file_path(output_dir_path)
+
+        # set path to model directory
+        file_finder = FileFinder(model_dir_path, Main.module_key_list)
+
+        # return file finder
+        return file_finder
+
+    # Description:
+    # This method converts many models one after another, with results of each model saved in subdirectory
+    # of output directory named after model directory. Conversion of remaining models continues when errors
+    # are found in one of models.
+    @staticmethod
+    def convert_models(output_dir_path, model_dir_path_list):
+
+        # list of models, which have not been converted due to errors
+        failed_model_dir_path_list = []
+
+        # for each model
+        for model_dir_path in model_dir_path_list:
+
+            # get model name from model directory path
+            model_name = basename(normpath(model_dir_path))
+            # get output directory path of model
+            model_output_dir_path = join(output_dir_path, model_name)
+            makedirs(model_output_dir_path, exist_ok=True)
+
+            # clear errors found in previous model
+            ErrorHandler.error_list = []
+
+            try:
+                # set paths to model and output directory
+                file_finder = Main.set_dir_paths(model_dir_path, model_output_dir_path)
+                # convert model
+                Main.convert_model(file_finder)
+
+                # if code generation is requested
+                if Main.code_dir_path != "":
+                    # get code directory path of model
+                    model_code_dir_path = join(Main.code_dir_path, model_name)
+                    makedirs(model_code_dir_path, exist_ok=True)
+                    # generate code from configuration file
+                    Main.run_cgc(model_code_dir_path)
+
+            except (SystemExit, OSError):
+                # conversion has been stopped due to errors or model directory is not accessible
+                failed_model_dir_path_list.append(model_dir_path)
+
+        # display summary
+        print()
+        print("Have converted " + str(len(model_dir_path_list) - len(failed_model_dir_path_list)) + " of " +
+              str(len(model_dir_path_list)) + " models")
+        for model_dir_path in failed_model_dir_path_list:
+            print("Have not converted model " + model_dir_path + " due to errors")
+
+        # if any model has not been converted, end run of MCG CC with error status
+        if len(failed_model_dir_path_list) > 0:
+            exit(1)
+
+    # Description:
+    # This method invokes conversion of model content in form of .exml files into configuration file.
+    @staticmethod
+    def convert_model(file_finder):
+
+        # saves log file header
+        Logger.save_log_file_header()
+        # saves configuration file header
+        ModuleConverter.save_configuration_file_header()
+
+        # if only some modules are requested
+        if Main.module_key_list:
+            # select requested modules and modules called by them from model index, unknown modules are
+            # recorded as errors, which end the run before any module is converted
+            file_finder.select_modules()
+
+        # load results of module conversion from previous run
+        ModuleCache.load_cache(Main.MCG_CC_VERSION)
+
+        # if more than one job is requested
+        if Main.number_of_jobs > 1:
+            # convert modules in worker processes
+            Main.convert_modules_in_parallel(file_finder)
+        else:
+            # convert modules one after another
+            Main.convert_modules_in_sequence(file_finder)
+
+        # save results of module conversion for next run
+        ModuleCache.save_cache()
         # saves configuration file footer
         ModuleConverter.save_configuration_file_footer()
         # saves log file footer
         Logger.save_log_file_footer()
 
+    # Description:
+    # This method runs MCG CGC on configuration file, if path to code directory is given.
+    @staticmethod
+    def run_cgc(code_dir_path):
+
+        # if code generation is requested
+        if code_dir_path != "":
+            # run MCG CGC in separate process, so its state does not mix with state of MCG CC
+            run([executable, Main.MCG_CGC_MAIN_PATH, ModuleConverter.configuration_file_path, code_dir_path])
+
+    # Description:
+    # This method returns state of model, or none if model directory is not accessible, e.g. when model catalog
+    # has been removed, so watching of model directory can continue.
+    @staticmethod
+    def get_model_state(file_finder):
+
+        try:
+            # return model state
+            return file_finder.get_model_state()
+
+        except OSError:
+            # return unknown model state
+            return None
+
+    # Description:
+    # This method watches model directory and converts model again after each change, until MCG CC is interrupted.
+    # FileFinder index and results of module conversion are kept in memory, so only new and changed .exml files
+    # are read again and only affected modules are converted again.
+    @staticmethod
+    def watch_model(file_finder, output_dir_path):
+
+        # state of model that was converted last time, none before first conversion or after failed conversion
+        converted_model_state_dict = None
+        # current state of model
+        model_state_dict = Main.get_model_state(file_finder)
+        # flag to distinguish if model files need to be indexed again before conversion, model is already indexed
+        # before first conversion
+        index_required = False
+
+        # repeat until MCG CC is interrupted
+        try:
+            while True:
+
+                # if model has changed since last conversion
+                if model_state_dict != converted_model_state_dict:
+
+                    # remember converted model state
+                    converted_model_state_dict = model_state_dict
+
+                    try:
+                        # if model files need to be indexed again
+                        if index_required:
+                            # index model files again
+                            file_finder.index_model()
+                            # clear configuration and log file
+                            ModuleConverter.set_configuration_file_path(output_dir_path)
+                            Logger.set_log_file_path(output_dir_path)
+
+                        # model needs to be indexed again before next conversion
+                        index_required = True
+
+                        # convert model
+                        Main.convert_model(file_finder)
+                        # generate code from configuration file
+                        Main.run_cgc(Main.code_dir_path)
+
+                    except SystemExit:
+                        # conversion has been stopped due to errors, which are already recorded in log file,
+                        # therefore clear errors and wait for next change
+                        ErrorHandler.error_list = []
+
+                    except OSError as os_error:
+                        # model files have been removed or replaced while being read, e.g. by editor saving model,
+                        # therefore clear errors and convert model again at next check
+                        ErrorHandler.error_list = []
+                        converted_model_state_dict = None
+                        # record info
+                        Logger.save_in_log_file("Main", "Model files are not accessible: " + str(os_error), True)
+
+                    # record info
+                    Logger.save_in_log_file("Main", "Watching model directory for changes", True)
+
+                # wait before next check and get current model state
+                sleep(Main.WATCH_INTERVAL)
+                previous_model_state_dict = model_state_dict
+                model_state_dict = Main.get_model_state(file_finder)
+
+                # wait until model state is the same in two checks in a row, so files still being saved are not read
+                while model_state_dict != previous_model_state_dict:
+                    sleep(Main.WATCH_INTERVAL)
+                    previous_model_state_dict = model_state_dict
+                    model_state_dict = Main.get_model_state(file_finder)
+
+        except KeyboardInterrupt:
+            # record info
+            Logger.save_in_log_file("Main", "Watching of model directory has been stopped", True)
+
 
-# Mod Code Generator (MCG) Converter Component (CC) entrance
-Main.main()
+# Mod Code Generator (MCG) Converter Component (CC) entrance,
+# guarded so that worker processes can import this module without starting new conversion
+if __name__ == "__main__":
+    Main.main()
@@ -0,0 +1,138 @@
+#   FILE:           mcg_cc_memory_benchmark.py
+#
+#   DESCRIPTION:
+#       This module contains definition of MemoryBenchmark class, which measures
+#       memory footprint of activity connections and nodes of large activity diagram.
+#
+#   COPYRIGHT:      Copyright (C) 2021-2026 Kamil Deć github.com/deckamil
+#   DATE:           17 OCT 2026
+#
+#   LICENSE:
+#       This file is part of Mod Code Generator (MCG).
+#
+#       MCG is free software: you can redistribute it and/or modify
+#       it under the terms of the GNU General Public License as published by
+#       the Free Software Foundation, either version 3 of the License, or
+#       (at your option) any later version.
+#
+#       MCG is distributed in the hope that it will be useful,
+#       but WITHOUT ANY WARRANTY; without even the implied warranty of
+#       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#       GNU General Public License for more details.
+#
+#       Under Section 7 of GPL version 3, you are granted additional
+#       permissions described in the MCG Output Exception, version 1, which
+#       copy you should have received along with this program.
+#
+#       You should have received a copy of the GNU General Public License
+#       along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+from sys import argv
+import tracemalloc
+from mcg_cc_activity_connection import ActivityConnection
+from mcg_cc_activity_layer import ActivityDiagramLayer
+from mcg_cc_activity_node import ActivityNode
+
+
+# Description:
+# This class allows to measure memory used by connections and nodes of activity diagram layer, which is built
+# in the same way as by FileReader and ModuleSorter, i.e. each action has one input and one output connection.
+class MemoryBenchmark(object):
+
+    # default number of connections on activity diagram
+    NUMBER_OF_CONNECTIONS = 100000
+
+    # number of different data names and uids, reused by connections as in case of real model
+    NUMBER_OF_NAMES = 1000
+
+    # Description:
+    # This method builds connections of activity diagram layer and returns memory used by them, in bytes.
+    @staticmethod
+    def measure_connections(diagram_layer, number_of_connections, name_list):
+
+        # start measurement
+        memory_before = tracemalloc.get_traced_memory()[0]
+
+        # build connections between data and actions
+        for connection_index in range(0, number_of_connections):
+            connection = ActivityConnection()
+            connection.index = connection_index
+            # each action has input connection from data and output connection to data
+            if connection_index % 2 == 0:
+                connection.source_name = name_list[connection_index % len(name_list)]
+                connection.source_type = ActivityConnection.LOCAL
+                connection.target_name = "ADD"
+                connection.target_uid = name_list[(connection_index // 2) % len(name_list)]
+                connection.target_type = ActivityConnection.ACTION
+            else:
+                connection.source_name = "ADD"
+                connection.source_uid = name_list[(connection_index // 2) % len(name_list)]
+                connection.source_type = ActivityConnection.ACTION
+                connection.target_name = name_list[connection_index % len(name_list)]
+                connection.target_type = ActivityConnection.LOCAL
+            diagram_layer.connection_list.append(connection)
+
+        # return memory used by connections
+        return tracemalloc.get_traced_memory()[0] - memory_before
+
+    # Description:
+    # This method builds nodes of activity diagram layer from its connections and returns memory used by them,
+    # in bytes.
+    @staticmethod
+    def measure_nodes(diagram_layer):
+
+        # start measurement
+        memory_before = tracemalloc.get_traced_memory()[0]
+
+        # build one node from each pair of input and output connection
+        for connection_index in range(0, len(diagram_layer.connection_list) - 1, 2):
+            input_connection = diagram_layer.connection_list[connection_index]
+            output_connection = diagram_layer.connection_list[connection_index + 1]
+            node = ActivityNode()
+            node.input_data_list.append((input_connection.source_name, input_connection.target_pin))
+            node.interaction = input_connection.target_name
+            node.uid = input_connection.target_uid
+            node.type = ActivityNode.ACTION
+            node.output_data_list.append((output_connection.target_name, output_connection.source_pin))
+            diagram_layer.node_list.append(node)
+
+        # return memory used by nodes
+        return tracemalloc.get_traced_memory()[0] - memory_before
+
+    # Description:
+    # This is main method, which runs benchmark and displays memory footprint of connections and nodes.
+    @staticmethod
+    def main():
+
+        # get number of connections from command line, if given
+        number_of_connections = MemoryBenchmark.NUMBER_OF_CONNECTIONS
+        if len(argv) > 1 and argv[1].isdigit() and int(argv[1]) > 1:
+            number_of_connections = int(argv[1])
+
+        # names and uids shared by connections
+        name_list = ["Data" + str(name_index) for name_index in range(0, MemoryBenchmark.NUMBER_OF_NAMES)]
+
+        # start tracing of memory allocations
+        tracemalloc.start()
+
+        # build diagram layer and measure its connections and nodes
+        diagram_layer = ActivityDiagramLayer()
+        connection_memory = MemoryBenchmark.measure_connections(diagram_layer, number_of_connections, name_list)
+        node_memory = MemoryBenchmark.measure_nodes(diagram_layer)
+        number_of_nodes = len(diagram_layer.node_list)
+
+        # stop tracing of memory allocations
+        tracemalloc.stop()
+
+        # display results
+        print("MCG CC memory benchmark")
+        print(str(number_of_connections) + " connections: " + str(connection_memory // 1024) + " KiB, " +
+              str(round(connection_memory / number_of_connections, 1)) + " bytes per connection")
+        print(str(number_of_nodes) + " nodes: " + str(node_memory // 1024) + " KiB, " +
+              str(round(node_memory / number_of_nodes, 1)) + " bytes per node")
+
+
+# run benchmark when module is executed as script
+if __name__ == "__main__":
+    MemoryBenchmark.main()
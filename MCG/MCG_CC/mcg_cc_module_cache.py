@@ -0,0 +1,238 @@
+#   FILE:           mcg_cc_module_cache.py
+#
+#   DESCRIPTION:
+#       This module contains definition of ModuleCache class, which is responsible
+#       for storing of module content and configuration between MCG CC runs.
+#
+#   COPYRIGHT:      Copyright (C) 2021-2026 Kamil Deć github.com/deckamil
+#   DATE:           17 OCT 2026
+#
+#   LICENSE:
+#       This file is part of Mod Code Generator (MCG).
+#
+#       MCG is free software: you can redistribute it and/or modify
+#       it under the terms of the GNU General Public License as published by
+#       the Free Software Foundation, either version 3 of the License, or
+#       (at your option) any later version.
+#
+#       MCG is distributed in the hope that it will be useful,
+#       but WITHOUT ANY WARRANTY; without even the implied warranty of
+#       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#       GNU General Public License for more details.
+#
+#       Under Section 7 of GPL version 3, you are granted additional
+#       permissions described in the MCG Output Exception, version 1, which
+#       copy you should have received along with this program.
+#
+#       You should have received a copy of the GNU General Public License
+#       along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import pickle
+from glob import glob
+from hashlib import sha256
+from os.path import abspath, basename, dirname, exists, join
+from mcg_cc_file_finder import FileFinder
+from mcg_cc_logger import Logger
+
+
+# Description:
+# This class allows to store results of module conversion, i.e. module configuration fragment from ModuleConverter,
+# in cache file within output directory, so modules described by unchanged .exml files do not need to be
+# converted again.
+class ModuleCache(object):
+
+    # initialize class data
+    cache_file_path = ""
+    cache_version = ""
+    # flag to distinguish if cache file has already been loaded, e.g. by previous conversion in watch mode
+    cache_loaded = False
+
+    # format of cache file content, changed whenever structure of cache entry changes
+    CACHE_FORMAT = 3
+
+    # module cache entries loaded from cache file and entries collected during current run,
+    # (module source path, activity source path) -> [file key, configuration file]
+    loaded_cache_dict = {}
+    cache_dict = {}
+
+    # file keys of modules looked up during current run,
+    # (module source path, activity source path) -> file key
+    file_key_dict = {}
+
+    # indexes of module key
+    MODULE_PATH_INDEX = 0
+    ACTIVITY_PATH_INDEX = 1
+
+    # indexes of cache entry
+    FILE_KEY_INDEX = 0
+    CONFIGURATION_FILE_INDEX = 1
+
+    # Description:
+    # This method sets path to cache file, which contains results of module conversion from previous MCG CC run.
+    @staticmethod
+    def set_cache_file_path(output_dir_path):
+
+        # set cache file path
+        ModuleCache.cache_file_path = join(output_dir_path, "mcg_cc_cache.pkl")
+        # cache file of new output directory needs to be loaded
+        ModuleCache.cache_loaded = False
+
+    # Description:
+    # This method loads results of module conversion from cache file, if the file was saved by the same
+    # MCG CC version built from the same source files. When cache has already been loaded by this process,
+    # results collected in memory during previous conversions are used instead.
+    @staticmethod
+    def load_cache(cache_version):
+
+        # if cache has already been loaded
+        if ModuleCache.cache_loaded:
+            # keep results of previous conversions, updated with results of the last one
+            ModuleCache.loaded_cache_dict.update(ModuleCache.cache_dict)
+            ModuleCache.cache_dict = {}
+            ModuleCache.file_key_dict = {}
+
+        else:
+            # set cache version, i.e. MCG CC version together with digest of its source files, so results
+            # converted by modified MCG CC are not used even if its version has not been changed
+            ModuleCache.cache_version = cache_version + " " + \
+                ModuleCache.get_source_digest(dirname(abspath(__file__)))
+            # clear module cache
+            ModuleCache.loaded_cache_dict = {}
+            ModuleCache.cache_dict = {}
+            ModuleCache.file_key_dict = {}
+
+            # if cache file exists
+            if exists(ModuleCache.cache_file_path):
+
+                try:
+                    # open file and load content, then close file
+                    cache_file_disk = open(ModuleCache.cache_file_path, "rb")
+                    loaded_cache_version, loaded_cache_format, loaded_cache_dict = pickle.load(cache_file_disk)
+                    cache_file_disk.close()
+
+                except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError,
+                        pickle.UnpicklingError):
+                    # cache file is not readable, therefore it will be replaced
+                    loaded_cache_version = ""
+                    loaded_cache_format = 0
+                    loaded_cache_dict = {}
+
+                # if cache file was saved by the same MCG CC version in the same format
+                if loaded_cache_version == ModuleCache.cache_version and \
+                        loaded_cache_format == ModuleCache.CACHE_FORMAT:
+                    # use loaded module cache
+                    ModuleCache.loaded_cache_dict = loaded_cache_dict
+
+            # set loaded flag
+            ModuleCache.cache_loaded = True
+
+        # record info
+        Logger.save_in_log_file("ModuleCache", "Have loaded " + str(len(ModuleCache.loaded_cache_dict)) +
+                                " modules from cache", False)
+
+    # Description:
+    # This method returns digest of MCG CC source files found in given directory, which changes whenever
+    # content of any MCG CC module changes.
+    @staticmethod
+    def get_source_digest(source_dir_path):
+
+        # digest of source files
+        source_digest = sha256()
+
+        # go through MCG CC source files in order of their names
+        for source_path in sorted(glob(join(source_dir_path, "mcg_cc_*.py"))):
+            # open file and read content, then close file
+            source_file_disk = open(source_path, "rb")
+            source_file = source_file_disk.read()
+            source_file_disk.close()
+            # update digest with file name, size and content
+            source_digest.update(basename(source_path).encode() + b"\0" + str(len(source_file)).encode() + b"\0")
+            source_digest.update(source_file)
+
+        # return digest
+        return source_digest.hexdigest()
+
+    # Description:
+    # This method saves results of module conversion collected during current run in cache file. Results of
+    # modules, which have not been looked for during current run, e.g. when only some modules are converted,
+    # are kept in cache file as long as their files exist.
+    @staticmethod
+    def save_cache():
+
+        # keep results of modules, which have not been looked for
+        for module_key in ModuleCache.loaded_cache_dict:
+            if module_key not in ModuleCache.file_key_dict and \
+                    exists(module_key[ModuleCache.MODULE_PATH_INDEX]) and \
+                    exists(module_key[ModuleCache.ACTIVITY_PATH_INDEX]):
+                ModuleCache.cache_dict[module_key] = ModuleCache.loaded_cache_dict[module_key]
+
+        # open file in write mode, save content, then close file
+        cache_file_disk = open(ModuleCache.cache_file_path, "wb")
+        pickle.dump((ModuleCache.cache_version, ModuleCache.CACHE_FORMAT, ModuleCache.cache_dict), cache_file_disk,
+                    pickle.HIGHEST_PROTOCOL)
+        cache_file_disk.close()
+
+        # record info
+        Logger.save_in_log_file("ModuleCache", "Have saved " + str(len(ModuleCache.cache_dict)) +
+                                " modules in cache file", False)
+
+    # Description:
+    # This method returns key of module, i.e. module and activity source paths.
+    @staticmethod
+    def get_module_key(file_finder_list):
+
+        # return module key
+        return (file_finder_list[FileFinder.MODULE_SOURCE_PATH_INDEX],
+                file_finder_list[FileFinder.ACTIVITY_SOURCE_PATH_INDEX])
+
+    # Description:
+    # This method returns key of module files, i.e. modification time and size of module and activity file,
+    # which changes whenever content of any of these files changes. Both are taken from model directory scan,
+    # so files do not need to be opened to detect changes.
+    @staticmethod
+    def get_file_key(file_finder, file_finder_list):
+
+        # return file key
+        return file_finder.get_file_key(file_finder_list[FileFinder.MODULE_SOURCE_PATH_INDEX]) + \
+            file_finder.get_file_key(file_finder_list[FileFinder.ACTIVITY_SOURCE_PATH_INDEX])
+
+    # Description:
+    # This method looks for module configuration fragment in cache and returns it, or returns empty list
+    # if module files have changed since the module was converted.
+    @staticmethod
+    def find_module(file_finder, file_finder_list):
+
+        # get module key and file key
+        module_key = ModuleCache.get_module_key(file_finder_list)
+        file_key = ModuleCache.get_file_key(file_finder, file_finder_list)
+        # remember file key, so module is stored under key of files that were actually read
+        ModuleCache.file_key_dict[module_key] = file_key
+
+        # assume that module is not found in cache
+        configuration_file = []
+
+        # if module is found in cache and its files have not changed
+        if module_key in ModuleCache.loaded_cache_dict and \
+                ModuleCache.loaded_cache_dict[module_key][ModuleCache.FILE_KEY_INDEX] == file_key:
+            # get module configuration
+            configuration_file = ModuleCache.loaded_cache_dict[module_key][ModuleCache.CONFIGURATION_FILE_INDEX]
+            # record info
+            Logger.save_in_log_file("ModuleCache", "Have found module " +
+                                    file_finder_list[FileFinder.MODULE_NAME_INDEX] + " " +
+                                    file_finder_list[FileFinder.MODULE_UID_INDEX] + " in cache", False)
+
+        # return module configuration
+        return configuration_file
+
+    # Description:
+    # This method stores module configuration fragment in cache.
+    @staticmethod
+    def store_module(file_finder_list, configuration_file):
+
+        # get module key and file key
+        module_key = ModuleCache.get_module_key(file_finder_list)
+        file_key = ModuleCache.file_key_dict[module_key]
+
+        # store module configuration
+        ModuleCache.cache_dict[module_key] = [file_key, configuration_file]
@@ -29,8 +29,8 @@
 
 
 import datetime
+from os.path import join
 from mcg_cc_activity_node import ActivityNode
-from mcg_cc_file_finder import FileFinder
 from mcg_cc_file_reader import FileReader
 from mcg_cc_logger import Logger
 
@@ -44,10 +44,10 @@ class ModuleConverter(object):
 
     # Description:
     # This is class constructor.
-    def __init__(self, file_finder_list, file_reader_list):
+    def __init__(self, module_name, file_reader_list):
 
         # initialize object data
-        self.module_name = file_finder_list[FileFinder.MODULE_NAME_INDEX]
+        self.module_name = module_name
         self.operation_name = file_reader_list[FileReader.OPERATION_NAME_INDEX]
         self.constant_list = file_reader_list[FileReader.CONSTANT_LIST_INDEX]
         self.input_interface_list = file_reader_list[FileReader.INPUT_INTERFACE_LIST_INDEX]
@@ -63,7 +63,7 @@ class ModuleConverter(object):
     def set_configuration_file_path(output_dir_path):
 
         # set configuration file path
-        ModuleConverter.configuration_file_path = output_dir_path + str("\\mcg_cgc_config.txt")
+        ModuleConverter.configuration_file_path = join(output_dir_path, "mcg_cgc_config.txt")
 
         # open new file in write mode, then close file, to clear previous content
         ModuleConverter.configuration_file_disk = open(ModuleConverter.configuration_file_path, "w")
@@ -116,14 +116,18 @@ class ModuleConverter(object):
         self.configuration_file.append(configuration_file_line)
 
     # Description:
-    # This method saves configuration in configuration file.
-    def save_in_configuration_file(self):
+    # This method saves configuration of one module in configuration file.
+    @staticmethod
+    def save_in_configuration_file(configuration_file):
+
+        # record info
+        Logger.save_in_log_file("ModuleConverter", "Saving conversion results into configuration file", False)
 
         # open file in append mode, ready to save fresh configuration file content
         ModuleConverter.configuration_file_disk = open(ModuleConverter.configuration_file_path, "a")
 
         # for each line in configuration file
-        for line in self.configuration_file:
+        for line in configuration_file:
             # write line to configuration file on hard disk
             ModuleConverter.configuration_file_disk.write(line)
             ModuleConverter.configuration_file_disk.write("\n")
@@ -513,8 +517,5 @@ class ModuleConverter(object):
         # append end marker of new module section to configuration file
         self.append_to_configuration_file("$MODULE END$", False)
 
-        # record info
-        Logger.save_in_log_file("ModuleConverter", "Saving conversion results into configuration file", False)
-
-        # save configuration file
-        self.save_in_configuration_file()
+        # return configuration file
+        return self.configuration_file
@@ -28,8 +28,10 @@
 #       along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
+from heapq import heappop, heappush
 from mcg_cc_activity_connection import ActivityConnection
 from mcg_cc_activity_node import ActivityNode
+from mcg_cc_error_handler import ErrorHandler
 from mcg_cc_file_reader import FileReader
 from mcg_cc_logger import Logger
 
@@ -50,6 +52,12 @@ class ModuleSorter(object):
         self.condition_layer_list = file_reader_list[FileReader.CONDITION_LAYER_LIST_INDEX]
         self.local_interface_list = file_reader_list[FileReader.LOCAL_INTERFACE_LIST_INDEX]
 
+        # positions of local data elements in local interface list, local data name -> list of positions
+        self.local_data_position_dict = {}
+        for position in range(0, len(self.local_interface_list)):
+            local_data_name = self.local_interface_list[position][FileReader.DATA_ELEMENT_NAME_INDEX]
+            self.local_data_position_dict.setdefault(local_data_name, []).append(position)
+
     # Description:
     # This method looks for list of activity interactions.
     def find_interactions(self):
@@ -75,26 +83,26 @@ class ModuleSorter(object):
     @staticmethod
     def find_interactions_from_layer(layer):
 
+        # interaction uids in order of appearance
+        interaction_uid_dict = {}
+
         # search for node interaction
         for connection in layer.connection_list:
 
             # if action or operation is connection source
             if connection.source_type == ActivityConnection.ACTION or \
                     connection.source_type == ActivityConnection.OPERATION:
-
-                # if new integration is found in connection
-                if connection.source_uid not in layer.interaction_uid_list:
-                    # append interaction uid to interaction uid list
-                    layer.interaction_uid_list.append(connection.source_uid)
+                # append interaction uid, unless it is already there
+                interaction_uid_dict.setdefault(connection.source_uid)
 
             # if action or operation is connection target
             if connection.target_type == ActivityConnection.ACTION or \
                     connection.target_type == ActivityConnection.OPERATION:
+                # append interaction uid, unless it is already there
+                interaction_uid_dict.setdefault(connection.target_uid)
 
-                # if new integration is found in connection
-                if connection.target_uid not in layer.interaction_uid_list:
-                    # append interaction uid to interaction uid list
-                    layer.interaction_uid_list.append(connection.target_uid)
+        # append interaction uids to interaction uid list
+        layer.interaction_uid_list.extend(interaction_uid_dict)
 
         # record info
         for interaction_uid in layer.interaction_uid_list:
@@ -125,49 +133,54 @@ class ModuleSorter(object):
     @staticmethod
     def find_nodes_from_layer(layer):
 
-        # search for nodes with interaction, i.e. nodes that represent either action or operation
+        # nodes with interaction, i.e. nodes that represent either action or operation,
+        # interaction uid -> node, in order of interaction uid list
+        node_dict = {}
         for interaction_uid in layer.interaction_uid_list:
-
             # new node instance
-            node = ActivityNode()
+            node_dict[interaction_uid] = ActivityNode()
 
-            # check source and target uid of each connection
-            for connection in layer.connection_list:
-
-                # if interaction is connection target then
-                # connection source is node input data
-                if interaction_uid == connection.target_uid:
-                    # get input data and pin name
-                    input_data_name = connection.source_name
-                    input_pin_name = connection.target_pin
-                    # set input link and append it to node input data list
-                    input_link = [input_data_name, input_pin_name]
-                    node.input_data_list.append(input_link)
-                    # set node interaction and uid
-                    node.interaction = connection.target_name
-                    node.uid = connection.target_uid
-
-                    # if action is connection target
-                    if connection.target_type == ActivityConnection.ACTION:
-                        # set node type
-                        node.type = ActivityNode.ACTION
-                    # if operation is connection target
-                    elif connection.target_type == ActivityConnection.OPERATION:
-                        # set node type
-                        node.type = ActivityNode.OPERATION
-
-                # if interaction is connection source then
-                # connection target is node output data
-                if interaction_uid == connection.source_uid:
-                    # get output data and pin name
-                    output_data_name = connection.target_name
-                    output_pin_name = connection.source_pin
-                    # set output link and append it to node output data list
-                    output_link = [output_data_name, output_pin_name]
-                    node.output_data_list.append(output_link)
-
-            # append node to node list
-            layer.node_list.append(node)
+        # check source and target uid of each connection
+        for connection in layer.connection_list:
+
+            # if interaction is connection target then
+            # connection source is node input data
+            if connection.target_uid in node_dict:
+                # get node
+                node = node_dict[connection.target_uid]
+                # get input data and pin name
+                input_data_name = connection.source_name
+                input_pin_name = connection.target_pin
+                # set input link and append it to node input data list
+                input_link = (input_data_name, input_pin_name)
+                node.input_data_list.append(input_link)
+                # set node interaction and uid
+                node.interaction = connection.target_name
+                node.uid = connection.target_uid
+
+                # if action is connection target
+                if connection.target_type == ActivityConnection.ACTION:
+                    # set node type
+                    node.type = ActivityNode.ACTION
+                # if operation is connection target
+                elif connection.target_type == ActivityConnection.OPERATION:
+                    # set node type
+                    node.type = ActivityNode.OPERATION
+
+            # if interaction is connection source then
+            # connection target is node output data
+            if connection.source_uid in node_dict:
+                # get node
+                node = node_dict[connection.source_uid]
+                # get output data and pin name
+                output_data_name = connection.target_name
+                output_pin_name = connection.source_pin
+                # set output link and append it to node output data list
+                output_link = (output_data_name, output_pin_name)
+                node.output_data_list.append(output_link)
+
+        # append nodes to node list
+        layer.node_list.extend(node_dict.values())
 
         # search for nodes without interaction, i.e. nodes that represent connection between two data points
         for connection in layer.connection_list:
@@ -184,7 +197,7 @@ class ModuleSorter(object):
                 input_data_name = connection.source_name
                 input_pin_name = connection.target_pin
                 # set input link and append it to node input data list
-                input_link = [input_data_name, input_pin_name]
+                input_link = (input_data_name, input_pin_name)
                 node.input_data_list.append(input_link)
                 # set node type
                 node.type = ActivityNode.DATA
@@ -192,7 +205,7 @@ class ModuleSorter(object):
                 output_data_name = connection.target_name
                 output_pin_name = connection.source_pin
                 # set output link and append it to node output data list
-                output_link = [output_data_name, output_pin_name]
+                output_link = (output_data_name, output_pin_name)
                 node.output_data_list.append(output_link)
 
                 # append node to node list
@@ -229,20 +242,31 @@ class ModuleSorter(object):
 
         # search for node dependencies
         for node in layer.node_list:
-            # go through all local data elements for each node
-            for local_interface in self.local_interface_list:
-                # get local data name
-                local_data_name = local_interface[FileReader.DATA_ELEMENT_NAME_INDEX]
-                # go through all input links
-                for input_link in node.input_data_list:
-                    # if local data element is input to node
-                    if local_data_name == input_link[ActivityNode.DATA_NAME_INDEX]:
-                        # append name of local data element to dependency list
-                        node.dependency_list.append(local_data_name)
-                        # record info
-                        Logger.save_in_log_file("ModuleSorter", "Have found dependency on " +
-                                                str(node.dependency_list) + " in " +
-                                                str(node) + " node", False)
+
+            # list of dependencies, i.e. [position in local interface list, local data name]
+            local_dependency_list = []
+
+            # go through all input links
+            for input_link in node.input_data_list:
+                # get input data name
+                input_data_name = input_link[ActivityNode.DATA_NAME_INDEX]
+                # if local data element is input to node
+                if input_data_name in self.local_data_position_dict:
+                    # append local data element for each of its positions in local interface list
+                    for position in self.local_data_position_dict[input_data_name]:
+                        local_dependency_list.append([position, input_data_name])
+
+            # keep order of local interface list
+            local_dependency_list.sort(key=lambda local_dependency: local_dependency[0])
+
+            # go through all local data elements, which are input to node
+            for position, local_data_name in local_dependency_list:
+                # append name of local data element to dependency list
+                node.dependency_list.append(local_data_name)
+                # record info
+                Logger.save_in_log_file("ModuleSorter", "Have found dependency on " +
+                                        str(node.dependency_list) + " in " +
+                                        str(node) + " node", False)
 
     # Description:
     # This method looks for condition nodes that represent condition layer and adds them to diagram node list.
@@ -283,7 +307,7 @@ class ModuleSorter(object):
                 output_data_name = condition_target
                 output_pin_name = "NOT APPLICABLE"
                 # set output link and append it to node output data list
-                output_link = [output_data_name, output_pin_name]
+                output_link = (output_data_name, output_pin_name)
                 node.output_data_list.append(output_link)
 
             # record info
@@ -312,34 +336,20 @@ class ModuleSorter(object):
                 # other clause node; if local input data element is not generated by any other clause node
                 # then that local data element is local input to entire condition
 
+                # get names of data outputted by clause nodes
+                clause_output_data_name_set = set()
+                for clause_node in clause_layer.node_list:
+                    for output_link in clause_node.output_data_list:
+                        clause_output_data_name_set.add(output_link[ActivityNode.DATA_NAME_INDEX])
+
                 # for each node in node list
                 for node_under_check in clause_layer.node_list:
-                    # for each dependency in dependency list
-                    for dependency in list(node_under_check.dependency_list):
-
-                        # flag to distinguish if given dependency is found in output data list of any clause node
-                        dependency_in_output_data_found = False
-
-                        for clause_node in clause_layer.node_list:
-                            # for each output link in output data list
-                            for output_link in clause_node.output_data_list:
-                                # if dependency is output from any clause node
-                                if dependency == output_link[ActivityNode.DATA_NAME_INDEX]:
-                                    # set dependency flag
-                                    dependency_in_output_data_found = True
-                                    # exit "for output_link in" loop
-                                    break
-
-                            # if dependency is found, then exit "for clause_node in" loop
-                            if dependency_in_output_data_found:
-                                break
-
-                        # if dependency is not found in output data list of any clause node, then add dependency
-                        # to condition dependency list
-                        if not dependency_in_output_data_found:
-                            # move dependency from clause to condition dependency list
-                            node_under_check.dependency_list.remove(dependency)
-                            condition_dependency_list.append(dependency)
+                    # if dependency is not found in output data list of any clause node, then move dependency
+                    # from clause to condition dependency list
+                    condition_dependency_list.extend([dependency for dependency in node_under_check.dependency_list
+                                                      if dependency not in clause_output_data_name_set])
+                    node_under_check.dependency_list = [dependency for dependency in node_under_check.dependency_list
+                                                        if dependency in clause_output_data_name_set]
 
                 # find if clause decision contains any dependency on any local data element, if local data
                 # element is found in clause decision then it means that it is an additional dependency of
@@ -365,19 +375,15 @@ class ModuleSorter(object):
                     clause_decision = clause_decision.replace(" LT ", "")
                     clause_decision = clause_decision.replace(" GE ", "")
                     clause_decision = clause_decision.replace(" LE ", "")
-                    # split decision to get list of data names that appear in clause decision
-                    clause_decision_data_name_list = clause_decision.split()
+                    # split decision to get set of data names that appear in clause decision
+                    clause_decision_data_name_set = set(clause_decision.split())
 
                     # go through all local data elements
-                    for local_interface in self.local_interface_list:
-                        # get local data name
-                        local_data_name = local_interface[FileReader.DATA_ELEMENT_NAME_INDEX]
-                        # go trough all clause decision data names
-                        for clause_decision_data_name in clause_decision_data_name_list:
-                            # if clause decision data name the same as local data name
-                            if clause_decision_data_name == local_data_name:
-                                # append name of local data element to condition dependency list
-                                condition_dependency_list.append(local_data_name)
+                    for local_data_name in self.local_data_position_dict:
+                        # if clause decision data name the same as local data name
+                        if local_data_name in clause_decision_data_name_set:
+                            # append name of local data element to condition dependency list
+                            condition_dependency_list.append(local_data_name)
 
             # remove duplicates from condition dependency list
             condition_dependency_list = list(dict.fromkeys(condition_dependency_list))
@@ -454,53 +460,86 @@ class ModuleSorter(object):
                 ModuleSorter.sort_nodes_under_layer(clause_layer)
 
     # Description:
-    # This method sorts nodes under given layer.
+    # This method sorts nodes under given layer. Node is sorted once all local data elements from its dependency
+    # list are outputted by already sorted nodes. Nodes are sorted in passes over node list, i.e. node that
+    # becomes ready after node placed further in node list is sorted in next pass. Nodes, which dependencies
+    # are never satisfied, e.g. due to cycle between nodes, are left in node list and recorded as errors.
     @staticmethod
     def sort_nodes_under_layer(layer):
 
-        # sort nodes as long at node list is not empty
-        while layer.node_list:
-
-            # sort nodes basing on their dependencies
-            # first append nodes without dependencies to sorted node list and remove them from node list
-            # then look through outputs from sorted node and remove local data elements outputted by the
-            # sorted node from dependency list of other nodes under referenced layer
-
-            # go through all nodes under layer
-            for node in list(layer.node_list):
-                # if node does not have any dependencies
-                if not node.dependency_list:
-                    # remove it from node list and add to sorted node list
-                    layer.node_list.remove(node)
-                    layer.sorted_node_list.append(node)
-                    # get output data list from sorted node
-                    output_data_list = node.output_data_list
-
-                    # remove outputs of that node from dependency list of other nodes under referenced layer
-                    for output_link in output_data_list:
-                        # get output data name
-                        output_data_name = output_link[ActivityNode.DATA_NAME_INDEX]
-                        # go through all nodes under given layer and refresh their dependency list
-                        ModuleSorter.remove_data_from_layer_node_dependencies(output_data_name, layer)
+        # positions of nodes depending on each local data element, data name -> list of node positions
+        consumer_dict = {}
+        # number of unsatisfied dependencies of each node
+        dependency_count_list = []
+        # local data elements outputted by sorted nodes
+        sorted_data_name_set = set()
+
+        # go through all nodes under layer
+        for position in range(0, len(layer.node_list)):
+            # get dependencies of node without duplicates
+            dependency_dict = dict.fromkeys(layer.node_list[position].dependency_list)
+            # set number of unsatisfied dependencies of node
+            dependency_count_list.append(len(dependency_dict))
+            # append node to consumers of each dependency
+            for dependency in dependency_dict:
+                consumer_dict.setdefault(dependency, []).append(position)
+
+        # positions of nodes without dependencies, which are sorted in current and in next pass over node list
+        current_pass_position_list = [position for position in range(0, len(layer.node_list))
+                                      if dependency_count_list[position] == 0]
+        next_pass_position_list = []
+
+        # sort nodes as long as any node is ready to be sorted
+        while current_pass_position_list:
+
+            # get node placed first in node list and add it to sorted node list
+            position = heappop(current_pass_position_list)
+            node = layer.node_list[position]
+            layer.sorted_node_list.append(node)
+
+            # go through outputs of sorted node
+            for output_link in node.output_data_list:
+                # get output data name
+                output_data_name = output_link[ActivityNode.DATA_NAME_INDEX]
+
+                # if output data has not been outputted by other sorted node yet
+                if output_data_name not in sorted_data_name_set:
+                    sorted_data_name_set.add(output_data_name)
+
+                    # satisfy dependency of each node, which depends on output data
+                    for consumer_position in consumer_dict.get(output_data_name, []):
+                        dependency_count_list[consumer_position] = dependency_count_list[consumer_position] - 1
+
+                        # if all dependencies of the node are satisfied
+                        if dependency_count_list[consumer_position] == 0:
+                            # if node is placed after sorted node, it is sorted in current pass
+                            if consumer_position > position:
+                                heappush(current_pass_position_list, consumer_position)
+                            # otherwise it is sorted in next pass
+                            else:
+                                heappush(next_pass_position_list, consumer_position)
+
+            # if current pass is finished, start next pass
+            if not current_pass_position_list:
+                current_pass_position_list = next_pass_position_list
+                next_pass_position_list = []
+
+        # leave nodes, which could not be sorted, in node list
+        layer.node_list = [layer.node_list[position] for position in range(0, len(layer.node_list))
+                           if dependency_count_list[position] > 0]
 
         # record info
         for sorted_node in layer.sorted_node_list:
             Logger.save_in_log_file("ModuleSorter", "Have sorted " + str(sorted_node) + " node",
                                     False)
 
-    # Description
-    # This method removes given data name from dependency list of each node under related layer.
-    @staticmethod
-    def remove_data_from_layer_node_dependencies(data_name, layer):
-
-        # go through all nodes under given layer
+        # record error for each node, which could not be sorted
         for node in layer.node_list:
-            # check all dependencies of that node
-            for dependency in list(node.dependency_list):
-                # if given data is found on dependency list
-                if data_name == dependency:
-                    # remove dependency form dependency list
-                    node.dependency_list.remove(dependency)
+            # get dependencies, which are not satisfied
+            unsatisfied_dependency_list = [dependency for dependency in dict.fromkeys(node.dependency_list)
+                                           if dependency not in sorted_data_name_set]
+            ErrorHandler.record_error(ErrorHandler.SORT_ERR_UNSATISFIED_NODE_DEPENDENCY, node,
+                                      unsatisfied_dependency_list)
 
     # Description
     # This method sorts input data elements if interaction requires to point main data input.
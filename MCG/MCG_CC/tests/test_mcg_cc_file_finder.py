@@ -0,0 +1,135 @@
+#   FILE:           test_mcg_cc_file_finder.py
+#
+#   DESCRIPTION:
+#       This module contains tests of FileFinder class, which selects modules
+#       requested for conversion together with modules called by them.
+#
+#   COPYRIGHT:      Copyright (C) 2021-2026 Kamil Deć github.com/deckamil
+#   DATE:           17 OCT 2026
+#
+#   LICENSE:
+#       This file is part of Mod Code Generator (MCG).
+#
+#       MCG is free software: you can redistribute it and/or modify
+#       it under the terms of the GNU General Public License as published by
+#       the Free Software Foundation, either version 3 of the License, or
+#       (at your option) any later version.
+#
+#       MCG is distributed in the hope that it will be useful,
+#       but WITHOUT ANY WARRANTY; without even the implied warranty of
+#       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#       GNU General Public License for more details.
+#
+#       Under Section 7 of GPL version 3, you are granted additional
+#       permissions described in the MCG Output Exception, version 1, which
+#       copy you should have received along with this program.
+#
+#       You should have received a copy of the GNU General Public License
+#       along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import sys
+import unittest
+from os.path import abspath, dirname, join
+
+# MCG CC modules import each other by module name, so their directory is added to search path
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from mcg_cc_error_handler import ErrorHandler
+from mcg_cc_file_finder import FileFinder
+from mcg_cc_logger import Logger
+
+
+# Description:
+# This class tests selection of modules from model, where Scaler calls operation of Clamper through action
+# named Limit, Clamper calls operation of Saturator and Limiter defines operation with the same name as
+# operation of Clamper, but is not called by any module.
+class TestSelectModules(unittest.TestCase):
+
+    # directory with .exml files of tested model
+    MODEL_DIR_PATH = join(dirname(abspath(__file__)), "fixtures", "model")
+
+    # uids of tested modules and operations
+    CLAMPER_UID = "b1d4f8a3-5c9e-4f72-8d1b-3e6a9c2f4b58"
+    CLAMP_OPERATION_UID = "b2e6a0c4-7f1d-4b98-c2f5-8a3d1e7b6c37"
+
+    # Description:
+    # This method prepares logger and error list before each test.
+    def setUp(self):
+
+        # collect log records instead of saving them in log file
+        Logger.enable_log_buffer()
+        # start with empty error list
+        ErrorHandler.error_list = []
+
+    # Description:
+    # This method clears logger and error list after each test.
+    def tearDown(self):
+        ErrorHandler.error_list = []
+        Logger.log_buffer_enabled = False
+
+    # Description:
+    # This method selects modules given by names or uids and returns sorted names of modules, which are then
+    # found by file finder.
+    @staticmethod
+    def select_modules(module_key_list):
+
+        # index model and select modules
+        file_finder = FileFinder(TestSelectModules.MODEL_DIR_PATH, module_key_list)
+        file_finder.select_modules()
+
+        # find all selected modules
+        module_name_list = []
+        file_finder_list = file_finder.find_file_paths()
+        while file_finder_list[FileFinder.FILES_FOUND_INDEX]:
+            module_name_list.append(file_finder_list[FileFinder.MODULE_NAME_INDEX])
+            file_finder_list = file_finder.find_file_paths()
+
+        # return sorted names of found modules
+        return sorted(module_name_list)
+
+    # Description:
+    # This method checks that all modules are found, when no module is requested.
+    def test_all_modules(self):
+        file_finder = FileFinder(TestSelectModules.MODEL_DIR_PATH, [])
+        self.assertEqual(sorted(file_finder.module_source_path_dict[module_uid][FileFinder.SOURCE_NAME_INDEX]
+                                for module_uid in file_finder.module_uid_list),
+                         ["Clamper", "Limiter", "Saturator", "Scaler"])
+
+    # Description:
+    # This method checks that modules called by requested module are selected through uids of called operations,
+    # not through names of actions that call them.
+    def test_select_by_name(self):
+        self.assertEqual(TestSelectModules.select_modules(["Scaler"]), ["Clamper", "Saturator", "Scaler"])
+        self.assertEqual(ErrorHandler.error_list, [])
+
+    # Description:
+    # This method checks selection of module given by uid.
+    def test_select_by_uid(self):
+        self.assertEqual(TestSelectModules.select_modules([TestSelectModules.CLAMPER_UID]), ["Clamper", "Saturator"])
+        self.assertEqual(ErrorHandler.error_list, [])
+
+    # Description:
+    # This method checks selection of module, which does not call other modules, and of module requested twice.
+    def test_select_without_callees(self):
+        self.assertEqual(TestSelectModules.select_modules(["Saturator", "Limiter", "Limiter"]),
+                         ["Limiter", "Saturator"])
+        self.assertEqual(ErrorHandler.error_list, [])
+
+    # Description:
+    # This method checks that unknown module is recorded as error and other requested modules are still selected.
+    def test_unknown_module(self):
+        self.assertEqual(TestSelectModules.select_modules(["Nope", "Saturator"]), ["Saturator"])
+        self.assertEqual(ErrorHandler.error_list, ["ERROR 151: Requested module Nope was not found in model"])
+
+    # Description:
+    # This method checks that only operations referred by Called relation are read from activity file,
+    # i.e. operation that owns the activity is not read.
+    def test_read_called_operation_uids(self):
+        self.assertEqual(FileFinder.read_called_operation_uids(join(TestSelectModules.MODEL_DIR_PATH,
+                                                                    "Standard.Activity", "scale_scaler.exml")),
+                         {TestSelectModules.CLAMP_OPERATION_UID})
+
+
+if __name__ == "__main__":
+    unittest.main()
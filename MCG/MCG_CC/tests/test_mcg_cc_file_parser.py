@@ -0,0 +1,103 @@
+#   FILE:           test_mcg_cc_file_parser.py
+#
+#   DESCRIPTION:
+#       This module contains tests of FileParser class, which classifies lines
+#       of .exml files.
+#
+#   COPYRIGHT:      Copyright (C) 2021-2026 Kamil Deć github.com/deckamil
+#   DATE:           17 OCT 2026
+#
+#   LICENSE:
+#       This file is part of Mod Code Generator (MCG).
+#
+#       MCG is free software: you can redistribute it and/or modify
+#       it under the terms of the GNU General Public License as published by
+#       the Free Software Foundation, either version 3 of the License, or
+#       (at your option) any later version.
+#
+#       MCG is distributed in the hope that it will be useful,
+#       but WITHOUT ANY WARRANTY; without even the implied warranty of
+#       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#       GNU General Public License for more details.
+#
+#       Under Section 7 of GPL version 3, you are granted additional
+#       permissions described in the MCG Output Exception, version 1, which
+#       copy you should have received along with this program.
+#
+#       You should have received a copy of the GNU General Public License
+#       along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import sys
+import unittest
+from os.path import abspath, dirname, join
+from tempfile import TemporaryDirectory
+
+# MCG CC modules import each other by module name, so their directory is added to search path
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from mcg_cc_file_lines import FileLines
+from mcg_cc_file_parser import FileParser, numpy
+
+
+# Description:
+# This class tests that lines classified with numpy are classified in the same way as stripped lines.
+@unittest.skipUnless(numpy is not None, "numpy is not available")
+class TestClassifyLinesWithNumpy(unittest.TestCase):
+
+    # directory with .exml files of tested module
+    FIXTURE_DIR_PATH = join(dirname(abspath(__file__)), "fixtures")
+
+    # lines with blank characters removed by strip method, including Unicode whitespace and line ends
+    BLANK_LINE_LIST = ["<ID name=\"x\" mc=\"Standard.InstanceNode\" uid=\"1\"/>\n",
+                       "\t\t<OBJECT>\r\n",
+                       "\u00a0<ID name=\"y\" mc=\"Standard.InstanceNode\" uid=\"2\"/>\n",
+                       "\u0085</OBJECT>\n",
+                       " \u2003<COMP relation=\"Output\">\n",
+                       "\u3000\t<ATT name=\"Name\"><![CDATA[y]]></ATT>\n",
+                       "\u00a0 \u00a0\n",
+                       "\u00e9<ID name=\"z\"/>\n",
+                       "<REFOBJ>\u00a0\n",
+                       "<ID\u00a0\n",
+                       "\x1c</LINK>\x1f\n",
+                       "\n",
+                       "<LINK relation=\"Called\">"]
+
+    # Description:
+    # This method checks that line class lists of given .exml file are the same for both methods.
+    def assert_same_classes(self, source_path):
+
+        # map file in memory, decoded as UTF-8 regardless of locale
+        source_file = FileLines(source_path)
+        source_file.encoding = "utf-8"
+        try:
+            self.assertEqual(FileParser.classify_lines_with_numpy(source_file),
+                             FileParser.classify_lines(list(source_file)))
+        finally:
+            source_file.close()
+
+    # Description:
+    # This method checks classification of .exml files exported by Modelio.
+    def test_fixture_files(self):
+        self.assert_same_classes(join(TestClassifyLinesWithNumpy.FIXTURE_DIR_PATH, "scaler_component.exml"))
+        self.assert_same_classes(join(TestClassifyLinesWithNumpy.FIXTURE_DIR_PATH, "scaler_activity.exml"))
+
+    # Description:
+    # This method checks classification of lines, which begin or end with ASCII or Unicode blank characters.
+    def test_blank_characters(self):
+
+        # write lines in UTF-8
+        temp_dir = TemporaryDirectory()
+        try:
+            source_path = join(temp_dir.name, "blank.exml")
+            source_file_disk = open(source_path, "w", encoding="utf-8", newline="")
+            source_file_disk.write("".join(TestClassifyLinesWithNumpy.BLANK_LINE_LIST))
+            source_file_disk.close()
+
+            self.assert_same_classes(source_path)
+        finally:
+            temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
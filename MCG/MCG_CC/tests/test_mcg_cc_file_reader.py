@@ -0,0 +1,117 @@
+#   FILE:           test_mcg_cc_file_reader.py
+#
+#   DESCRIPTION:
+#       This module contains tests of FileReader class, which read module
+#       content from .exml files laid out as exported by Modelio.
+#
+#   COPYRIGHT:      Copyright (C) 2021-2026 Kamil Deć github.com/deckamil
+#   DATE:           17 OCT 2026
+#
+#   LICENSE:
+#       This file is part of Mod Code Generator (MCG).
+#
+#       MCG is free software: you can redistribute it and/or modify
+#       it under the terms of the GNU General Public License as published by
+#       the Free Software Foundation, either version 3 of the License, or
+#       (at your option) any later version.
+#
+#       MCG is distributed in the hope that it will be useful,
+#       but WITHOUT ANY WARRANTY; without even the implied warranty of
+#       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#       GNU General Public License for more details.
+#
+#       Under Section 7 of GPL version 3, you are granted additional
+#       permissions described in the MCG Output Exception, version 1, which
+#       copy you should have received along with this program.
+#
+#       You should have received a copy of the GNU General Public License
+#       along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import sys
+import unittest
+from os.path import abspath, dirname, join
+
+# MCG CC modules import each other by module name, so their directory is added to search path
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from mcg_cc_file_finder import FileFinder
+from mcg_cc_file_lines import FileLines
+from mcg_cc_file_reader import FileReader
+from mcg_cc_logger import Logger
+
+
+# Description:
+# This class tests reading of module from .exml files, where local data represents module constant through
+# RepresentedAttribute relation and condition owns its clauses through OwnedClause relation, as in Modelio export.
+class TestFileReader(unittest.TestCase):
+
+    # directory with .exml files of tested module
+    FIXTURE_DIR_PATH = join(dirname(abspath(__file__)), "fixtures")
+
+    # Description:
+    # This method reads tested module before each test.
+    def setUp(self):
+
+        # collect log records instead of saving them in log file
+        Logger.enable_log_buffer()
+
+        # map module and activity files
+        self.module_file = FileLines(join(TestFileReader.FIXTURE_DIR_PATH, "scaler_component.exml"))
+        self.activity_file = FileLines(join(TestFileReader.FIXTURE_DIR_PATH, "scaler_activity.exml"))
+        file_finder_list = [None] * (FileFinder.ACTIVITY_FILE_INDEX + 1)
+        file_finder_list[FileFinder.MODULE_FILE_INDEX] = self.module_file
+        file_finder_list[FileFinder.ACTIVITY_FILE_INDEX] = self.activity_file
+
+        # read module
+        self.file_reader_list = FileReader(file_finder_list).read_files()
+
+    # Description:
+    # This method releases files after each test.
+    def tearDown(self):
+        self.module_file.close()
+        self.activity_file.close()
+        Logger.log_buffer_enabled = False
+
+    # Description:
+    # This method checks operation name, constants and interfaces of module.
+    def test_interfaces(self):
+        self.assertEqual(self.file_reader_list[FileReader.OPERATION_NAME_INDEX], "Scale")
+        self.assertEqual(self.file_reader_list[FileReader.CONSTANT_LIST_INDEX], [["INT32", "K", "3"]])
+        self.assertEqual(self.file_reader_list[FileReader.INPUT_INTERFACE_LIST_INDEX],
+                         [["INT32", "x"], ["BOOL", "flag"]])
+        self.assertEqual(self.file_reader_list[FileReader.OUTPUT_INTERFACE_LIST_INDEX], [["INT32", "y"]])
+        # local data represented by constant is not local interface
+        self.assertEqual(self.file_reader_list[FileReader.LOCAL_INTERFACE_LIST_INDEX], [["INT32", "scaled"]])
+
+    # Description:
+    # This method checks connections of diagram layer.
+    def test_diagram_layer(self):
+        diagram_layer = self.file_reader_list[FileReader.DIAGRAM_LAYER_INDEX]
+        self.assertEqual([str(connection) for connection in diagram_layer.connection_list],
+                         ["$SOURCE$: x $TARGET$: MUL 8c3a5e1b-f4d7-4029-b6e3-a91d5c7f0b28",
+                          "$SOURCE$: K $TARGET$: MUL 8c3a5e1b-f4d7-4029-b6e3-a91d5c7f0b28",
+                          "$SOURCE$: scaled $TARGET$: v Clamp() 39f0b7d2-e6a4-4c51-a8d3-1b7e5f9c0a64",
+                          "$SOURCE$: scaled $TARGET$: COPY 0d4e8a2c-7b5f-4e91-b3c6-d8a1f0e7c952",
+                          "$SOURCE$: MUL 8c3a5e1b-f4d7-4029-b6e3-a91d5c7f0b28 $TARGET$: scaled"])
+
+    # Description:
+    # This method checks condition layer, its clause layers and their connections.
+    def test_condition_layer(self):
+        condition_layer_list = self.file_reader_list[FileReader.CONDITION_LAYER_LIST_INDEX]
+        self.assertEqual([str(condition_layer) for condition_layer in condition_layer_list],
+                         ["$CONDITION$: IF f5b9d2c7-1a6e-4e83-8c04-7d2a9f6b3e15"])
+
+        clause_layer_list = condition_layer_list[0].clause_layer_list
+        self.assertEqual([str(clause_layer) for clause_layer in clause_layer_list],
+                         ["$CLAUSE$: flag == 1 2e7c4f9a-b8d1-4a56-9e30-c5f1a8d3b7e4",
+                          "$CLAUSE$: else a6d1e8b3-5c92-4f07-b1a4-0e8f3c6d9a27"])
+        # output pin of operation under first clause is connected to output parameter
+        self.assertEqual([str(connection) for connection in clause_layer_list[0].connection_list],
+                         ["$SOURCE$: r Clamp() 39f0b7d2-e6a4-4c51-a8d3-1b7e5f9c0a64 $TARGET$: y"])
+        self.assertEqual([str(connection) for connection in clause_layer_list[1].connection_list],
+                         ["$SOURCE$: COPY 0d4e8a2c-7b5f-4e91-b3c6-d8a1f0e7c952 $TARGET$: y"])
+
+
+if __name__ == "__main__":
+    unittest.main()
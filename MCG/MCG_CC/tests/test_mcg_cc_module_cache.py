@@ -0,0 +1,184 @@
+#   FILE:           test_mcg_cc_module_cache.py
+#
+#   DESCRIPTION:
+#       This module contains tests of ModuleCache class, which stores results
+#       of module conversion between runs of MCG CC.
+#
+#   COPYRIGHT:      Copyright (C) 2021-2026 Kamil Deć github.com/deckamil
+#   DATE:           17 OCT 2026
+#
+#   LICENSE:
+#       This file is part of Mod Code Generator (MCG).
+#
+#       MCG is free software: you can redistribute it and/or modify
+#       it under the terms of the GNU General Public License as published by
+#       the Free Software Foundation, either version 3 of the License, or
+#       (at your option) any later version.
+#
+#       MCG is distributed in the hope that it will be useful,
+#       but WITHOUT ANY WARRANTY; without even the implied warranty of
+#       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#       GNU General Public License for more details.
+#
+#       Under Section 7 of GPL version 3, you are granted additional
+#       permissions described in the MCG Output Exception, version 1, which
+#       copy you should have received along with this program.
+#
+#       You should have received a copy of the GNU General Public License
+#       along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import sys
+import unittest
+from os import mkdir, stat, utime
+from os.path import abspath, dirname, join
+from shutil import copytree
+from tempfile import TemporaryDirectory
+
+# MCG CC modules import each other by module name, so their directory is added to search path
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from mcg_cc_file_finder import FileFinder
+from mcg_cc_logger import Logger
+from mcg_cc_module_cache import ModuleCache
+
+
+# Description:
+# This class tests reuse of module conversion results saved in cache file by previous run.
+class TestModuleCache(unittest.TestCase):
+
+    # directory with .exml files of tested model
+    MODEL_DIR_PATH = join(dirname(abspath(__file__)), "fixtures", "model")
+
+    # Description:
+    # This method copies tested model to temporary directory before each test.
+    def setUp(self):
+
+        # collect log records instead of saving them in log file
+        Logger.enable_log_buffer()
+
+        # copy model, so its files can be changed, and create output directory
+        self.temp_dir = TemporaryDirectory()
+        self.model_dir_path = join(self.temp_dir.name, "model")
+        self.output_dir_path = join(self.temp_dir.name, "output")
+        copytree(TestModuleCache.MODEL_DIR_PATH, self.model_dir_path)
+        mkdir(self.output_dir_path)
+
+    # Description:
+    # This method removes temporary directory and clears cache after each test.
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        ModuleCache.cache_loaded = False
+        ModuleCache.loaded_cache_dict = {}
+        ModuleCache.cache_dict = {}
+        ModuleCache.file_key_dict = {}
+        Logger.log_buffer_enabled = False
+
+    # Description:
+    # This method runs conversion of model with given MCG CC version, where each module not found in cache
+    # is converted into configuration with module name, and returns sorted names of modules found in cache.
+    def run_conversion(self, cache_version):
+
+        # load cache file of output directory, as new run of MCG CC does
+        ModuleCache.set_cache_file_path(self.output_dir_path)
+        ModuleCache.load_cache(cache_version)
+
+        # names of modules found in cache
+        cached_module_name_list = []
+
+        # go through all modules of model
+        file_finder = FileFinder(self.model_dir_path, [])
+        file_finder_list = file_finder.find_file_paths()
+        while file_finder_list[FileFinder.FILES_FOUND_INDEX]:
+            # get module name
+            module_name = file_finder_list[FileFinder.MODULE_NAME_INDEX]
+
+            # look for module configuration in cache, or convert module
+            configuration_file = ModuleCache.find_module(file_finder, file_finder_list)
+            if configuration_file:
+                self.assertEqual(configuration_file, ["$MODULE$: " + module_name])
+                cached_module_name_list.append(module_name)
+            else:
+                configuration_file = ["$MODULE$: " + module_name]
+
+            # store module configuration and look for next module
+            ModuleCache.store_module(file_finder_list, configuration_file)
+            file_finder_list = file_finder.find_file_paths()
+
+        # save cache file
+        ModuleCache.save_cache()
+
+        # return sorted names of modules found in cache
+        return sorted(cached_module_name_list)
+
+    # Description:
+    # This method checks that all modules are found in cache, when model has not changed.
+    def test_cache_hit(self):
+        self.assertEqual(self.run_conversion("v1"), [])
+        self.assertEqual(self.run_conversion("v1"), ["Clamper", "Limiter", "Saturator", "Scaler"])
+
+    # Description:
+    # This method checks that module is not found in cache, when its activity file has changed.
+    def test_file_change(self):
+        self.assertEqual(self.run_conversion("v1"), [])
+
+        # change activity file of Saturator together with its modification time
+        activity_source_path = join(self.model_dir_path, "Standard.Activity", "saturate_saturator.exml")
+        activity_file_disk = open(activity_source_path, "a")
+        activity_file_disk.write("\n")
+        activity_file_disk.close()
+        activity_stat = stat(activity_source_path)
+        utime(activity_source_path, ns=(activity_stat.st_atime_ns, activity_stat.st_mtime_ns + 1000000000))
+
+        self.assertEqual(self.run_conversion("v1"), ["Clamper", "Limiter", "Scaler"])
+        self.assertEqual(self.run_conversion("v1"), ["Clamper", "Limiter", "Saturator", "Scaler"])
+
+    # Description:
+    # This method checks that cache file saved in other format is discarded.
+    def test_format_mismatch(self):
+        self.assertEqual(self.run_conversion("v1"), [])
+
+        # change format of cache file content
+        cache_format = ModuleCache.CACHE_FORMAT
+        ModuleCache.CACHE_FORMAT = cache_format + 1
+        try:
+            self.assertEqual(self.run_conversion("v1"), [])
+            self.assertEqual(ModuleCache.loaded_cache_dict, {})
+        finally:
+            ModuleCache.CACHE_FORMAT = cache_format
+
+    # Description:
+    # This method checks that cache file saved by other MCG CC version is discarded.
+    def test_version_mismatch(self):
+        self.assertEqual(self.run_conversion("v1"), [])
+        self.assertEqual(self.run_conversion("v2"), [])
+        self.assertEqual(ModuleCache.loaded_cache_dict, {})
+
+    # Description:
+    # This method checks that digest of MCG CC source files changes only when any of these files changes.
+    def test_source_digest(self):
+
+        # write source file of MCG CC and other file
+        source_file_disk = open(join(self.output_dir_path, "mcg_cc_main.py"), "w")
+        source_file_disk.write("MCG_CC_VERSION = \"v1\"\n")
+        source_file_disk.close()
+        other_file_disk = open(join(self.output_dir_path, "other.py"), "w")
+        other_file_disk.write("pass\n")
+        other_file_disk.close()
+        source_digest = ModuleCache.get_source_digest(self.output_dir_path)
+
+        # other file does not change digest
+        other_file_disk = open(join(self.output_dir_path, "other.py"), "a")
+        other_file_disk.write("pass\n")
+        other_file_disk.close()
+        self.assertEqual(ModuleCache.get_source_digest(self.output_dir_path), source_digest)
+
+        # source file of MCG CC changes digest
+        source_file_disk = open(join(self.output_dir_path, "mcg_cc_main.py"), "a")
+        source_file_disk.write("\n")
+        source_file_disk.close()
+        self.assertNotEqual(ModuleCache.get_source_digest(self.output_dir_path), source_digest)
+
+
+if __name__ == "__main__":
+    unittest.main()
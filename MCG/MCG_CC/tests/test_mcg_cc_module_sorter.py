@@ -0,0 +1,216 @@
+#   FILE:           test_mcg_cc_module_sorter.py
+#
+#   DESCRIPTION:
+#       This module contains tests of ModuleSorter class, which sorts nodes of
+#       activity diagram layer basing on their dependencies.
+#
+#   COPYRIGHT:      Copyright (C) 2021-2026 Kamil Deć github.com/deckamil
+#   DATE:           17 OCT 2026
+#
+#   LICENSE:
+#       This file is part of Mod Code Generator (MCG).
+#
+#       MCG is free software: you can redistribute it and/or modify
+#       it under the terms of the GNU General Public License as published by
+#       the Free Software Foundation, either version 3 of the License, or
+#       (at your option) any later version.
+#
+#       MCG is distributed in the hope that it will be useful,
+#       but WITHOUT ANY WARRANTY; without even the implied warranty of
+#       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#       GNU General Public License for more details.
+#
+#       Under Section 7 of GPL version 3, you are granted additional
+#       permissions described in the MCG Output Exception, version 1, which
+#       copy you should have received along with this program.
+#
+#       You should have received a copy of the GNU General Public License
+#       along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import sys
+import unittest
+from os.path import abspath, dirname
+from random import Random
+
+# MCG CC modules import each other by module name, so their directory is added to search path
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from mcg_cc_activity_layer import ActivityDiagramLayer
+from mcg_cc_activity_node import ActivityNode
+from mcg_cc_error_handler import ErrorHandler
+from mcg_cc_logger import Logger
+from mcg_cc_module_sorter import ModuleSorter
+
+
+# Description:
+# This class tests sorting of nodes under layer, which must keep order of sorting in passes over node list
+# and must leave nodes with unsatisfied dependencies in node list.
+class TestSortNodesUnderLayer(unittest.TestCase):
+
+    # Description:
+    # This method prepares logger and error list before each test.
+    def setUp(self):
+
+        # collect log records instead of saving them in log file
+        Logger.enable_log_buffer()
+        # start with empty error list
+        ErrorHandler.error_list = []
+
+    # Description:
+    # This method clears logger and error list after each test.
+    def tearDown(self):
+        ErrorHandler.error_list = []
+        Logger.log_buffer_enabled = False
+
+    # Description:
+    # This method returns layer with action nodes described by node spec list, i.e. list of
+    # (action name, list of dependencies, list of outputs) tuples.
+    @staticmethod
+    def make_layer(node_spec_list):
+
+        # new layer instance
+        layer = ActivityDiagramLayer()
+
+        # append node for each node spec
+        for node_spec in node_spec_list:
+            node = ActivityNode()
+            node.type = ActivityNode.ACTION
+            node.interaction = node_spec[0]
+            node.uid = node_spec[0] + "-uid"
+            node.input_data_list = [(dependency, "") for dependency in node_spec[1]]
+            node.dependency_list = list(node_spec[1])
+            node.output_data_list = [(output, "") for output in node_spec[2]]
+            layer.node_list.append(node)
+
+        # return layer
+        return layer
+
+    # Description:
+    # This method returns action names of layer nodes, sorted as before dependency counts were introduced,
+    # i.e. in repeated passes over node list, which remove outputs of each sorted node from dependency list
+    # of other nodes. It is used as reference of sorting order for layers without unsatisfied dependencies.
+    @staticmethod
+    def sort_in_passes(layer):
+
+        # action names of sorted nodes
+        sorted_name_list = []
+
+        # sort nodes as long as node list is not empty
+        while layer.node_list:
+            # go through all nodes under layer
+            for node in list(layer.node_list):
+                # if node does not have any dependencies
+                if not node.dependency_list:
+                    # remove it from node list and add its name to sorted name list
+                    layer.node_list.remove(node)
+                    sorted_name_list.append(node.interaction)
+                    # remove outputs of that node from dependency list of other nodes
+                    for output_link in node.output_data_list:
+                        for other_node in layer.node_list:
+                            other_node.dependency_list = [dependency for dependency in other_node.dependency_list
+                                                          if dependency != output_link[ActivityNode.DATA_NAME_INDEX]]
+
+        # return action names of sorted nodes
+        return sorted_name_list
+
+    # Description:
+    # This method checks that nodes are sorted in the same order as in passes over node list.
+    def assert_pass_order(self, node_spec_list):
+
+        # sort layer nodes
+        layer = TestSortNodesUnderLayer.make_layer(node_spec_list)
+        ModuleSorter.sort_nodes_under_layer(layer)
+
+        # compare with reference order
+        self.assertEqual([node.interaction for node in layer.sorted_node_list],
+                         TestSortNodesUnderLayer.sort_in_passes(TestSortNodesUnderLayer.make_layer(node_spec_list)))
+        self.assertEqual(layer.node_list, [])
+        self.assertEqual(ErrorHandler.error_list, [])
+
+    # Description:
+    # This method checks order of nodes, which become ready after nodes placed further in node list.
+    def test_order_of_passes(self):
+
+        # D and F are sorted in first pass, C placed before D is sorted in second pass, A in third pass
+        # and then B and E placed after it are sorted in the same pass
+        node_spec_list = [("A", ["c"], ["a"]),
+                          ("B", ["a", "d"], ["b"]),
+                          ("C", ["d"], ["c"]),
+                          ("D", [], ["d"]),
+                          ("E", ["b", "b"], ["e"]),
+                          ("F", [], ["f"])]
+        self.assert_pass_order(node_spec_list)
+
+        # sort layer nodes and check order explicitly
+        layer = TestSortNodesUnderLayer.make_layer(node_spec_list)
+        ModuleSorter.sort_nodes_under_layer(layer)
+        self.assertEqual([node.interaction for node in layer.sorted_node_list], ["D", "F", "C", "A", "B", "E"])
+
+    # Description:
+    # This method checks order of randomly generated layers without unsatisfied dependencies, where local data
+    # elements may be outputted by more than one node and may be listed more than once in dependency list.
+    def test_order_of_random_layers(self):
+
+        random = Random(2026)
+        for layer_number in range(0, 200):
+            node_number = random.randint(1, 30)
+
+            # nodes in order of their readiness, each depends on outputs of nodes created before it
+            node_spec_list = []
+            output_list = []
+            for position in range(0, node_number):
+                dependency_list = [random.choice(output_list) for dependency_number in range(0, random.randint(0, 3))
+                                   if output_list]
+                output = "d" + str(random.randint(0, position))
+                node_spec_list.append(("N" + str(position), dependency_list, [output]))
+                output_list.append(output)
+
+            # place nodes in random order in node list
+            random.shuffle(node_spec_list)
+            self.assert_pass_order(node_spec_list)
+
+    # Description:
+    # This method checks that nodes with cyclic dependencies are left in node list and recorded as errors.
+    def test_cycle(self):
+
+        # A and B depend on each other
+        layer = TestSortNodesUnderLayer.make_layer([("A", ["y"], ["x"]),
+                                                    ("B", ["x"], ["y"]),
+                                                    ("C", [], ["z"])])
+        node_a = layer.node_list[0]
+        node_b = layer.node_list[1]
+        ModuleSorter.sort_nodes_under_layer(layer)
+
+        self.assertEqual([node.interaction for node in layer.sorted_node_list], ["C"])
+        self.assertEqual(layer.node_list, [node_a, node_b])
+        self.assertEqual(ErrorHandler.error_list,
+                         ["ERROR 101: Unsatisfied dependency on ['y'] was found in "
+                          "$INPUTS$: y $ACTION$: A A-uid $OUTPUT$: x node",
+                          "ERROR 101: Unsatisfied dependency on ['x'] was found in "
+                          "$INPUTS$: x $ACTION$: B B-uid $OUTPUT$: y node"])
+
+    # Description:
+    # This method checks that nodes depending on data without producer are left in node list and recorded
+    # as errors, while dependencies satisfied by sorted nodes are not reported.
+    def test_missing_producer(self):
+
+        # no node outputs n, so A and B, which depends on A, cannot be sorted
+        layer = TestSortNodesUnderLayer.make_layer([("A", ["n", "z"], ["x"]),
+                                                    ("B", ["x"], ["y"]),
+                                                    ("C", [], ["z"])])
+        node_a = layer.node_list[0]
+        node_b = layer.node_list[1]
+        ModuleSorter.sort_nodes_under_layer(layer)
+
+        self.assertEqual([node.interaction for node in layer.sorted_node_list], ["C"])
+        self.assertEqual(layer.node_list, [node_a, node_b])
+        self.assertEqual(ErrorHandler.error_list,
+                         ["ERROR 101: Unsatisfied dependency on ['n'] was found in "
+                          "$INPUTS$: n z $ACTION$: A A-uid $OUTPUT$: x node",
+                          "ERROR 101: Unsatisfied dependency on ['x'] was found in "
+                          "$INPUTS$: x $ACTION$: B B-uid $OUTPUT$: y node"])
+
+
+if __name__ == "__main__":
+    unittest.main()